@@ -1,129 +1,212 @@
 import json
 import os
 import re
+from array import array
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_BUFSIZE = 1 << 20  # read whole scripts in as few syscalls as possible
+_FUNC_HEAD_RE = re.compile(rb'\w+\s*\([^)]*\)\s*\{')
+# Every byte except delimiters and newlines, for bytes.translate(None, ...)
+_DELIM_DELETE = bytes(c for c in range(256) if c not in b'{}[]()\n')
+_BRACKETS_DELETE = _DELIM_DELETE + b'\n'
+_BRACKET_PAIR_RE = re.compile(rb'\(\)|\[\]|\{\}')
+_LINE_BREAK_RE = re.compile(rb'\r\n?|\n')
+_MAX_PAIR_PASSES = 32  # deeper nesting falls back to the stack scan
+_MAX_PER_CATEGORY = 1000  # bounds memory and report size on garbage files
 
 def read_file_list(file_path):
     """Read the list of AHK files from the text file."""
-    with open(file_path, 'r', encoding='utf-8') as f:
+    with open(file_path, 'r', encoding='utf-8', buffering=_BUFSIZE) as f:
         files = [line.strip() for line in f if line.strip()]
     return files
 
-def check_indentation(lines):
-    """Check indentation consistency and standards."""
-    issues = []
+def add_issue(issues, line, description):
+    """Record an issue, keeping at most _MAX_PER_CATEGORY per category.
+
+    Past the cap a single trailing marker counts the omitted issues; its line
+    is that of the first one left out.
+    """
+    if len(issues) < _MAX_PER_CATEGORY:
+        issues.append({'line': line, 'description': description})
+    elif len(issues) == _MAX_PER_CATEGORY:
+        issues.append({'line': line, 'description': '... 1 more omitted', 'omitted': 1})
+    else:
+        marker = issues[-1]
+        marker['omitted'] += 1
+        marker['description'] = f"... {marker['omitted']} more omitted"
+
+def count_issues(issues):
+    """Return how many issues a category found, including omitted ones."""
+    if len(issues) > _MAX_PER_CATEGORY:
+        return _MAX_PER_CATEGORY + issues[-1]['omitted']
+    return len(issues)
+
+def find_line_starts(content):
+    r"""Return the offset of the start of every line in content (bytes).
+
+    Lines end at \n, \r\n or a lone \r. The other separators str.splitlines()
+    knows (\x0b, \x0c, \x1c-\x1e, \x85, \u2028, \u2029) do not end a line.
+    """
+    line_starts = array('i', [0])
+    if content.count(b'\r') != content.count(b'\r\n'):
+        # Lone \r endings present; rare, so take the slower regex scan
+        line_starts.extend(m.end() for m in _LINE_BREAK_RE.finditer(content))
+        return line_starts
+    pos = content.find(b'\n')
+    while pos != -1:
+        line_starts.append(pos + 1)
+        pos = content.find(b'\n', pos + 1)
+    return line_starts
+
+def check_lines(content, line_starts):
+    """Run the indentation, comment and structure checks in one pass over lines.
+
+    Lines are sliced out of content one at a time using line_starts, so the
+    file is never held as a list of line strings.
+    Returns a tuple of (indentation, comments, structure) issue lists; block
+    comments are checked separately by check_block_comments.
+    """
+    indent_issues = []
+    comment_issues = []
+    structure_issues = []
     indent_type = None
     indent_size = 4  # standard 4 spaces
+    in_function = False
+    in_class = False
+    expected_indent = 0
 
-    for i, line in enumerate(lines, 1):
+    last = len(line_starts) - 1
+    for i, start in enumerate(line_starts, 1):
+        if i <= last:
+            end = line_starts[i] - 1  # drop the \n or lone \r
+        else:
+            end = len(content)
+        if end > start and content[end - 1:end] == b'\r':
+            end -= 1
+        line = content[start:end]
         stripped = line.lstrip()
         if not stripped:  # empty line
             continue
         indent = line[:len(line) - len(stripped)]
 
+        # Indentation
         if indent:
             if indent_type is None:
-                if '\t' in indent:
+                if b'\t' in indent:
                     indent_type = 'tab'
                 else:
                     indent_type = 'space'
 
-            # Check consistency
-            if indent_type == 'tab' and ' ' in indent:
-                issues.append({
-                    'line': i,
-                    'description': 'Mixed indentation: spaces found in tab-indented file'
-                })
-            elif indent_type == 'space' and '\t' in indent:
-                issues.append({
-                    'line': i,
-                    'description': 'Mixed indentation: tabs found in space-indented file'
-                })
-
-            # Check multiples
+            # Each indent type needs only its own checks
             if indent_type == 'space':
-                if len(indent) % indent_size != 0:
-                    issues.append({
-                        'line': i,
-                        'description': f'Indentation not multiple of {indent_size} spaces'
-                    })
-            elif indent_type == 'tab':
-                # For tabs, check if consistent (all tabs)
-                if indent != '\t' * (len(indent) // len('\t')):
-                    issues.append({
-                        'line': i,
-                        'description': 'Inconsistent tab usage'
-                    })
+                if b'\t' in indent:
+                    add_issue(indent_issues, i, 'Mixed indentation: tabs found in space-indented file')
+                if len(indent) & 3:  # indent_size is 4
+                    add_issue(indent_issues, i, f'Indentation not multiple of {indent_size} spaces')
+            elif indent.count(b'\t') != len(indent):
+                # Tab-indented, but not all tabs
+                if b' ' in indent:
+                    add_issue(indent_issues, i, 'Mixed indentation: spaces found in tab-indented file')
+                add_issue(indent_issues, i, 'Inconsistent tab usage')
+
+        # Comments: the line starts with ';' after its indent, so it can
+        # never be an inline comment and only the space after ';' matters
+        if stripped.startswith(b';'):
+            if len(stripped) > 1 and stripped[1:2] != b' ':
+                add_issue(comment_issues, i, 'Missing space after ; in comment')
+            continue
 
-    return issues
+        # Structure: detect function/class start
+        if _FUNC_HEAD_RE.match(stripped):
+            in_function = True
+            expected_indent = len(indent) + indent_size
+        elif stripped.startswith(b'class ') and b'{' in stripped:
+            in_class = True
+            expected_indent = len(indent) + indent_size
+        elif stripped.rstrip() == b'}':
+            if in_function:
+                in_function = False
+                expected_indent = max(0, expected_indent - indent_size)
+            elif in_class:
+                in_class = False
+                expected_indent = max(0, expected_indent - indent_size)
+        elif in_function or in_class:
+            if len(indent) != expected_indent:
+                add_issue(structure_issues, i, f'Incorrect indentation in {"function" if in_function else "class"}: expected {expected_indent} spaces, found {len(indent)}')
+
+    return indent_issues, comment_issues, structure_issues
+
+def check_indentation(content, line_starts=None):
+    """Check indentation consistency and standards."""
+    if line_starts is None:
+        line_starts = find_line_starts(content)
+    return check_lines(content, line_starts)[0]
 
-def check_line_endings(content):
+def check_line_endings(content, line_starts=None):
     """Check line ending consistency."""
     issues = []
-    lines = content.splitlines(keepends=True)
-    if not lines:
-        return issues
+    if line_starts is None:
+        line_starts = find_line_starts(content)
 
-    # Detect first line ending
+    # Detect first line ending; every line start after the first sits just
+    # past a line break, so the newlines are already located. Lone \r breaks
+    # are not compared but still count as lines, as in the other checks
     first_ending = None
-    for line in lines:
-        if line.endswith('\r\n'):
+    for line_no in range(1, len(line_starts)):
+        pos = line_starts[line_no] - 1
+        if content[pos] == 13:  # lone \r
+            continue
+        if pos > 0 and content[pos - 1:pos] == b'\r':
             ending = 'CRLF'
-        elif line.endswith('\n'):
-            ending = 'LF'
         else:
-            continue  # no ending or just \r
+            ending = 'LF'
         if first_ending is None:
             first_ending = ending
         elif ending != first_ending:
-            issues.append({
-                'line': lines.index(line) + 1,
-                'description': f'Inconsistent line ending: {ending} found, expected {first_ending}'
-            })
+            add_issue(issues, line_no, f'Inconsistent line ending: {ending} found, expected {first_ending}')
             break  # only report first inconsistency
 
     return issues
 
-def check_comments(lines):
-    """Check comment formatting."""
+def check_block_comments(content):
+    """Check multi-line /* */ comments are balanced."""
     issues = []
-
-    for i, line in enumerate(lines, 1):
-        stripped = line.strip()
-        if not stripped.startswith(';'):
-            continue
-
-        # Check single-line comments
-        if ';' in line:
-            comment_start = line.find(';')
-            if comment_start > 0:
-                # Inline comment
-                before_comment = line[:comment_start].rstrip()
-                if before_comment and not line[comment_start - 1].isspace():
-                    issues.append({
-                        'line': i,
-                        'description': 'Missing space before inline comment'
-                    })
-            # Check space after ;
-            if len(line) > comment_start + 1 and line[comment_start + 1] != ' ':
-                issues.append({
-                    'line': i,
-                    'description': 'Missing space after ; in comment'
-                })
-
-    # Check multi-line comments /* */
-    content = '\n'.join(lines)
-    # Simple check for balanced /* */
-    open_count = content.count('/*')
-    close_count = content.count('*/')
+    # Simple check for balanced /* */, counted directly on the file text
+    open_count = content.count(b'/*')
+    close_count = content.count(b'*/')
     if open_count != close_count:
-        issues.append({
-            'line': 1,  # approximate
-            'description': f'Unbalanced multi-line comments: {open_count} /* vs {close_count} */'
-        })
-
+        add_issue(issues, 1,  # approximate
+                  f'Unbalanced multi-line comments: {open_count} /* vs {close_count} */')
     return issues
 
+def check_comments(content, line_starts=None):
+    """Check comment formatting."""
+    if line_starts is None:
+        line_starts = find_line_starts(content)
+    return check_lines(content, line_starts)[1] + check_block_comments(content)
+
+def brackets_balanced(content):
+    """Fast path for check_syntax: True if every delimiter is properly matched.
+
+    Repeatedly deletes adjacent ()/[]/{} pairs from the delimiter-only text
+    with a regex, so well-formed files never reach the Python stack loop.
+    Returns False when unbalanced or nested deeper than _MAX_PAIR_PASSES.
+    """
+    brackets = content.translate(None, _BRACKETS_DELETE)
+    for _ in range(_MAX_PAIR_PASSES):
+        if not brackets:
+            return True
+        brackets, removed = _BRACKET_PAIR_RE.subn(b'', brackets)
+        if not removed:
+            return False
+    return not brackets
+
 def check_syntax(content):
     """Check basic syntax: balanced delimiters."""
     issues = []
@@ -131,100 +214,96 @@ def check_syntax(content):
     delimiters = {'{': '}', '[': ']', '(': ')'}
     closers = {v: k for k, v in delimiters.items()}
 
-    lines = content.splitlines()
-    for i, line in enumerate(lines, 1):
-        for char in line:
-            if char in delimiters:
-                stack.append((char, i))
-            elif char in closers:
-                if not stack:
-                    issues.append({
-                        'line': i,
-                        'description': f'Unmatched closing delimiter: {char}'
-                    })
-                else:
-                    opener, open_line = stack.pop()
-                    if closers[char] != opener:
-                        issues.append({
-                            'line': i,
-                            'description': f'Mismatched delimiter: expected {delimiters[opener]}, found {char}'
-                        })
+    if brackets_balanced(content):
+        return issues
+
+    # Count lone \r breaks as lines like find_line_starts does; they are
+    # rare, so only then pay for a normalized copy before the translate
+    if content.count(b'\r') != content.count(b'\r\n'):
+        content = content.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+
+    # Only delimiters and newlines survive the translate; the result is
+    # pure ASCII and short, so decode it to keep the loop on str characters
+    i = 1
+    for char in content.translate(None, _DELIM_DELETE).decode('ascii'):
+        if char == '\n':
+            i += 1
+        elif char in delimiters:
+            stack.append((char, i))
+        elif char in closers:
+            if not stack:
+                add_issue(issues, i, f'Unmatched closing delimiter: {char}')
+            else:
+                opener, open_line = stack.pop()
+                if closers[char] != opener:
+                    add_issue(issues, i, f'Mismatched delimiter: expected {delimiters[opener]}, found {char}')
 
     while stack:
         opener, open_line = stack.pop()
-        issues.append({
-            'line': open_line,
-            'description': f'Unmatched opening delimiter: {opener}'
-        })
+        add_issue(issues, open_line, f'Unmatched opening delimiter: {opener}')
 
     return issues
 
-def check_structure(lines):
+def check_structure(content, line_starts=None):
     """Check structural elements: functions and classes indentation."""
-    issues = []
-    indent_size = 4
-    in_function = False
-    in_class = False
-    expected_indent = 0
-
-    for i, line in enumerate(lines, 1):
-        stripped = line.strip()
-        if not stripped or stripped.startswith(';'):
-            continue
-
-        indent = len(line) - len(line.lstrip())
-
-        # Detect function/class start
-        if re.match(r'^\w+\s*\([^)]*\)\s*\{', stripped):
-            in_function = True
-            expected_indent = indent + indent_size
-        elif stripped.startswith('class ') and '{' in stripped:
-            in_class = True
-            expected_indent = indent + indent_size
-        elif stripped == '}':
-            if in_function:
-                in_function = False
-                expected_indent = max(0, expected_indent - indent_size)
-            elif in_class:
-                in_class = False
-                expected_indent = max(0, expected_indent - indent_size)
-        elif in_function or in_class:
-            if indent != expected_indent:
-                issues.append({
-                    'line': i,
-                    'description': f'Incorrect indentation in {"function" if in_function else "class"}: expected {expected_indent} spaces, found {indent}'
-                })
-
-    return issues
+    if line_starts is None:
+        line_starts = find_line_starts(content)
+    return check_lines(content, line_starts)[2]
 
 def check_file(file_path):
     """Check a single AHK file and return issues."""
-    issues = defaultdict(list)
-
     try:
-        with open(file_path, 'r', encoding='utf-8', newline='') as f:
+        with open(file_path, 'rb', buffering=_BUFSIZE) as f:
             content = f.read()
-            lines = content.splitlines()
-
-        # Indentation
-        issues['indentation'] = check_indentation(lines)
+        line_starts = find_line_starts(content)
 
-        # Line endings
-        issues['line_endings'] = check_line_endings(content)
+        # Indentation, comments and structure share a single pass
+        indentation, comments, structure = check_lines(content, line_starts)
+        comments.extend(check_block_comments(content))
 
-        # Comments
-        issues['comments'] = check_comments(lines)
+        return {
+            'indentation': indentation,
+            'line_endings': check_line_endings(content, line_starts),
+            'comments': comments,
+            'syntax': check_syntax(content),
+            'structure': structure,
+        }
 
-        # Syntax
-        issues['syntax'] = check_syntax(content)
+    except Exception as e:
+        return {'errors': [{'line': 1, 'description': f'Error reading file: {str(e)}'}]}
 
-        # Structure
-        issues['structure'] = check_structure(lines)
+def find_existing_files(files):
+    """Return the set of files that exist, listing each directory once.
 
-    except Exception as e:
-        issues['errors'] = [{'line': 1, 'description': f'Error reading file: {str(e)}'}]
+    Directories holding a single listed file are stat'ed directly instead.
+    Symlinks and names missing from the listing (e.g. a different case on a
+    case-insensitive filesystem) fall back to os.path.exists, so the result
+    matches calling it on every path.
+    """
+    by_dir = defaultdict(list)
+    for file_path in files:
+        by_dir[os.path.dirname(file_path)].append(file_path)
 
-    return dict(issues)
+    existing = set()
+    for dir_path, paths in by_dir.items():
+        if len(paths) == 1:
+            existing.update(p for p in paths if os.path.exists(p))
+            continue
+        try:
+            with os.scandir(dir_path or '.') as it:
+                entries = {entry.name: entry for entry in it}
+        except OSError:
+            # Unlistable (e.g. execute-only) directories can still hold
+            # reachable files
+            existing.update(p for p in paths if os.path.exists(p))
+            continue
+        for p in paths:
+            entry = entries.get(os.path.basename(p))
+            if entry is not None and not entry.is_symlink():
+                existing.add(p)
+            elif os.path.exists(p):  # broken symlinks and listing misses
+                existing.add(p)
+    return existing
 
 def main():
     file_list_path = 'ahk_files_list.txt'
@@ -235,22 +314,35 @@ def main():
     total_issues = 0
     category_counts = defaultdict(int)
 
+    existing = find_existing_files(files)
+    to_check = []
     for file_path in files:
-        if not os.path.exists(file_path):
+        if file_path in existing:
+            to_check.append(file_path)
+        else:
             print(f"Warning: File not found: {file_path}")
-            continue
 
-        print(f"Checking: {file_path}")
-        file_issues = check_file(file_path)
-        if any(file_issues.values()):  # only include files with issues
-            report[file_path] = file_issues
-            for category, issues in file_issues.items():
-                total_issues += len(issues)
-                category_counts[category] += len(issues)
+    # Files are independent, so check them across processes; map() keeps
+    # results (and progress output) in list order
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(check_file, to_check, chunksize=16)
+        for file_path, file_issues in zip(to_check, results):
+            print(f"Checking: {file_path}")
+            if any(file_issues.values()):  # only include files with issues
+                report[file_path] = file_issues
+                for category, issues in file_issues.items():
+                    count = count_issues(issues)
+                    total_issues += count
+                    category_counts[category] += count
 
     # Write report
-    with open(report_path, 'w', encoding='utf-8') as f:
-        json.dump(report, f, indent=2)
+    if orjson is not None:
+        with open(report_path, 'wb') as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    else:
+        # Encode in one go; json.dump issues many small writes
+        with open(report_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(report, indent=2, ensure_ascii=False))
 
     # Summary
     print("\n=== Formatting Check Summary ===")
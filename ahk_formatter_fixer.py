@@ -1,7 +1,34 @@
 import json
 import os
 import shutil
-import re
+
+_BUFSIZE = 1 << 20  # read whole scripts in as few syscalls as possible
+
+def remove_if_exists(path):
+    """Delete path, ignoring a file that is already gone."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+def backup_file(file_path, backup_path):
+    """Back file_path up as a hardlink, copying only when linking fails.
+
+    The new backup is made under a temporary name and renamed over the old
+    one, so a failure never leaves the file without a backup and a copy can
+    never write through an older link.
+    """
+    backup_tmp = backup_path + '.tmp'
+    remove_if_exists(backup_tmp)
+    try:
+        try:
+            os.link(file_path, backup_tmp)
+        except OSError:
+            shutil.copyfile(file_path, backup_tmp)
+        os.replace(backup_tmp, backup_path)
+    except BaseException:
+        remove_if_exists(backup_tmp)
+        raise
 
 def main():
     report_path = 'formatting_issues_report.json'
@@ -21,39 +48,55 @@ def main():
         return
 
     fixed_files = 0
+    unchanged_files = 0
     errors = []
 
     for file_path, issues in report.items():
         if 'indentation' in issues and issues['indentation']:
             try:
-                # Backup
-                backup_path = os.path.join(backup_dir, os.path.basename(file_path))
-                shutil.copy2(file_path, backup_path)
-
                 # Read file
-                with open(file_path, 'r', encoding='utf-8') as f:
+                with open(file_path, 'r', encoding='utf-8', buffering=_BUFSIZE) as f:
                     lines = f.readlines()
 
                 # Fix indentation
                 fixed_lines = []
+                changed = False
                 for line in lines:
-                    match = re.match(r'^([ \t]*)(.*)$', line)
-                    indent = match.group(1)
-                    rest = match.group(2)
-                    if indent:
-                        # Calculate indent level in spaces (treating tabs as 4 spaces)
-                        indent_spaces = indent.replace('\t', '    ')
-                        indent_len = len(indent_spaces)
-                        tabs = indent_len // 4
-                        spaces = indent_len % 4
-                        new_indent = '\t' * tabs + ' ' * spaces
+                    rest = line.lstrip(' \t')
+                    if len(rest) == len(line):
+                        fixed_lines.append(line)
+                        continue
+                    indent = line[:len(line) - len(rest)]
+                    # Calculate indent level in spaces (treating tabs as 4 spaces)
+                    tab_count = indent.count('\t')
+                    indent_len = tab_count * 4 + (len(indent) - tab_count)
+                    tabs, spaces = divmod(indent_len, 4)
+                    new_indent = '\t' * tabs + ' ' * spaces
+                    if new_indent == indent:
+                        fixed_lines.append(line)
                     else:
-                        new_indent = ''
-                    fixed_lines.append(new_indent + rest)
+                        fixed_lines.append(new_indent + rest)
+                        changed = True
+
+                # Leave files whose fix is a no-op untouched (no backup, no write)
+                if not changed:
+                    unchanged_files += 1
+                    continue
+
+                backup_file(file_path, os.path.join(backup_dir, os.path.basename(file_path)))
 
-                # Write back
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.writelines(fixed_lines)
+                # Write back to a new file and swap it in, leaving the
+                # original inode (and so the backup) untouched; a failed
+                # write leaves no .tmp file next to the script
+                tmp_path = file_path + '.tmp'
+                try:
+                    with open(tmp_path, 'w', encoding='utf-8') as f:
+                        f.write(''.join(fixed_lines))
+                    shutil.copymode(file_path, tmp_path)
+                    os.replace(tmp_path, file_path)
+                except BaseException:
+                    remove_if_exists(tmp_path)
+                    raise
 
                 fixed_files += 1
                 print(f"Fixed: {file_path}")
@@ -64,6 +107,7 @@ def main():
     # Summary
     print(f"\n=== Fix Summary ===")
     print(f"Files fixed: {fixed_files}")
+    print(f"Files already correctly indented: {unchanged_files}")
     if errors:
         print("Errors encountered:")
         for error in errors:
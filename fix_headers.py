@@ -2,82 +2,133 @@
 """
 Fix missing #Requires and #SingleInstance directives in AHK v2 files.
 """
+import json
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 
-def fix_ahk_headers(scripts_dir):
-    """Add missing #Requires and #SingleInstance headers to AHK files."""
+from list_ahk_files import iter_ahk_entries
+
+HEAD_BYTES = 2048  # prefix searched for existing headers
+WRITE_BUFSIZE = 1 << 16
+HEADER_RE = re.compile(rb'(#Requires AutoHotkey v2)|(#SingleInstance)')
+CACHE_PATH = '.header_cache.json'  # {path: st_mtime_ns} of files known to be fixed
+REQUIRES_LINE_RE = re.compile(rb'^[^\r\n]*#Requires AutoHotkey v2[^\r\n]*', re.MULTILINE)
+
+# Header bytes to splice in, per line-ending style
+REQUIRES_HEADER = {nl: b'#Requires AutoHotkey v2.0' + nl for nl in (b'\n', b'\r\n')}
+BOTH_HEADERS = {nl: REQUIRES_HEADER[nl] + b'#SingleInstance Force' + nl for nl in REQUIRES_HEADER}
+SINGLEINSTANCE_AFTER = {nl: nl + b'#SingleInstance Force' for nl in REQUIRES_HEADER}
+
+def process_file(filepath):
+    """Add missing headers to one AHK file.
+
+    Returns (modified, requires_added, singleinstance_added, message), where
+    message is the line to report for this file, if any.
+    """
+    requires_added = False
+    singleinstance_added = False
+
+    # Fast path: most files already have both headers, which can be seen
+    # from a small prefix without reading the whole file. The directives are
+    # ASCII, so everything stays as bytes
+    try:
+        with open(filepath, 'rb') as f:
+            head = f.read(HEAD_BYTES)
+            has_requires = has_singleinstance = False
+            for m in HEADER_RE.finditer(head):
+                if m.group(1):
+                    has_requires = True
+                else:
+                    has_singleinstance = True
+            if has_requires and has_singleinstance:
+                return False, False, False, None
+            content = head + f.read()
+        # Only files that are about to be rewritten need to be valid UTF-8
+        content.decode('utf-8')
+    except Exception as e:
+        return False, False, False, f"Error reading {filepath}: {e}"
+
+    # Inserted lines follow the file's own line endings
+    nl = b'\r\n' if b'\r\n' in head else b'\n'
+
+    # Both directives go at the top of the file: either as a prefix, or with
+    # #SingleInstance right after an existing #Requires line
+    if not has_requires:
+        requires_added = True
+        if has_singleinstance:
+            content = REQUIRES_HEADER[nl] + content
+        else:
+            content = BOTH_HEADERS[nl] + content
+            singleinstance_added = True
+    else:
+        end = REQUIRES_LINE_RE.search(content).end()
+        content = b''.join((content[:end], SINGLEINSTANCE_AFTER[nl], content[end:]))
+        singleinstance_added = True
+
+    try:
+        with open(filepath, 'wb', buffering=WRITE_BUFSIZE) as f:
+            f.write(content)
+    except Exception as e:
+        return False, False, False, f"Error writing {filepath}: {e}"
+    return True, requires_added, singleinstance_added, f"Fixed: {filepath}"
+
+def load_cache(cache_path):
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_cache(cache_path, cache):
+    tmp_path = cache_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(cache))
+    os.replace(tmp_path, cache_path)
+
+def fix_ahk_headers(scripts_dir, cache_path=CACHE_PATH):
+    """Add missing #Requires and #SingleInstance headers to AHK files.
+
+    Files whose mtime matches the cache from a previous run already have
+    both headers and are not read again.
+    """
     fixed_count = 0
     requires_added = 0
     singleinstance_added = 0
 
-    for root, dirs, files in os.walk(scripts_dir):
-        for file in files:
-            if not file.endswith(".ahk"):
-                continue
-
-            filepath = os.path.join(root, file)
-
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    content = f.read()
-            except Exception as e:
-                print(f"Error reading {filepath}: {e}")
-                continue
-
-            lines = content.split('\n')
-            modified = False
-
-            # Check if #Requires is present
-            has_requires = any("#Requires AutoHotkey v2" in line for line in lines[:15])
-
-            # Check if #SingleInstance is present
-            has_singleinstance = any("#SingleInstance" in line for line in lines[:15])
-
-            if not has_requires or not has_singleinstance:
-                new_lines = []
-                requires_inserted = False
-                singleinstance_inserted = False
-
-                # Process lines
-                for i, line in enumerate(lines):
-                    # If we haven't inserted #Requires yet
-                    if not has_requires and not requires_inserted:
-                        # Insert at the very beginning (before any comments)
-                        if i == 0:
-                            new_lines.append("#Requires AutoHotkey v2.0")
-                            requires_inserted = True
-                            requires_added += 1
-                            modified = True
-
-                    # Add the original line
-                    new_lines.append(line)
-
-                    # If we just added #Requires, add #SingleInstance next
-                    if requires_inserted and not has_singleinstance and not singleinstance_inserted:
-                        new_lines.append("#SingleInstance Force")
-                        singleinstance_inserted = True
-                        singleinstance_added += 1
-                        modified = True
-                    # If #Requires already exists, insert #SingleInstance after it
-                    elif not requires_inserted and "#Requires AutoHotkey v2" in line and not has_singleinstance and not singleinstance_inserted:
-                        new_lines.append("#SingleInstance Force")
-                        singleinstance_inserted = True
-                        singleinstance_added += 1
-                        modified = True
-
-                if modified:
-                    try:
-                        with open(filepath, 'w', encoding='utf-8') as f:
-                            f.write('\n'.join(new_lines))
-                        fixed_count += 1
-                        print(f"Fixed: {filepath}")
-                    except Exception as e:
-                        print(f"Error writing {filepath}: {e}")
+    cache = load_cache(cache_path)
+    new_cache = {}
+    pending = []
+    for entry in iter_ahk_entries(scripts_dir):
+        mtime = entry.stat().st_mtime_ns
+        if cache.get(entry.path) == mtime:
+            new_cache[entry.path] = mtime
+        else:
+            pending.append((entry.path, mtime))
+    skipped = len(new_cache)
+
+    # Files are independent and the work is mostly I/O, so overlap it in
+    # threads; map() keeps the report in walk order
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        results = executor.map(process_file, [path for path, _ in pending])
+        for (path, mtime), (modified, requires, singleinstance, message) in zip(pending, results):
+            if message:
+                print(message)
+            fixed_count += modified
+            requires_added += requires
+            singleinstance_added += singleinstance
+            # Only files left with both headers are cached; errors are retried
+            if modified:
+                new_cache[path] = os.stat(path).st_mtime_ns
+            elif message is None:
+                new_cache[path] = mtime
+
+    save_cache(cache_path, new_cache)
 
     print(f"\n{'='*60}")
     print(f"Summary:")
     print(f"  Files modified: {fixed_count}")
+    print(f"  Files skipped (unchanged since last run): {skipped}")
     print(f"  #Requires added: {requires_added}")
     print(f"  #SingleInstance added: {singleinstance_added}")
     print(f"{'='*60}")
@@ -1,54 +1,215 @@
 import gradio as gr
+import atexit
 import json
+import mmap
 import os
+import queue
+import threading
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configuration
 DATA_PATH = "data/samples.jsonl"
+SHARDS_DIR = "data/shards"  # written by scripts/split_samples.py
+MANIFEST_PATH = os.path.join(SHARDS_DIR, "manifest.json")
 GRADES_PATH = "data/graded_samples.jsonl"
 
+# Grade lines are read and written as bytes so orjson can be used when present
+if orjson is not None:
+    loads = orjson.loads
+
+    def dump_line(obj):
+        return orjson.dumps(obj) + b"\n"
+else:
+    loads = json.loads
+
+    def dump_line(obj):
+        return (json.dumps(obj) + "\n").encode("utf-8")
+
+def index_shard(path):
+    """Index the byte offset of every record in one JSONL file.
+
+    Returns the open file and the offsets; records are parsed on demand by
+    read_example, so only the index stays in memory.
+    """
+    f = open(path, "rb")
+    offsets = array("q")
+    pos = 0
+    for line in f:
+        if line.strip():
+            offsets.append(pos)
+        pos += len(line)
+    return f, offsets
+
+def manifest_is_current(manifest):
+    """True unless DATA_PATH has changed since the shards were written.
+
+    Without DATA_PATH the shards are all there is, so they are used as is.
+    """
+    try:
+        st = os.stat(DATA_PATH)
+    except FileNotFoundError:
+        return True
+    source = manifest.get("source") or {}
+    return source.get("size") == st.st_size and source.get("mtime_ns") == st.st_mtime_ns
+
 def load_data():
+    """Describe the sample shards and return (shards, starts, total).
+
+    With a current shard manifest, shards are only indexed on first use;
+    otherwise DATA_PATH is indexed up front as the single shard.
+    """
+    if os.path.exists(MANIFEST_PATH):
+        with open(MANIFEST_PATH, "rb") as f:
+            manifest = loads(f.read())
+        if manifest_is_current(manifest):
+            shards = [{"path": os.path.join(SHARDS_DIR, s["file"]), "file": None, "offsets": None}
+                      for s in manifest["shards"]]
+            return shards, [s["start"] for s in manifest["shards"]], manifest["total"]
+        print(f"Warning: {DATA_PATH} changed since {SHARDS_DIR} was written; "
+              f"reading it directly. Rerun scripts/split_samples.py to refresh the shards.")
     if not os.path.exists(DATA_PATH):
-        return []
-    with open(DATA_PATH, "r", encoding="utf-8") as f:
-        return [json.loads(line) for line in f if line.strip()]
+        return [], [], 0
+    f, offsets = index_shard(DATA_PATH)
+    return [{"path": DATA_PATH, "file": f, "offsets": offsets}], [0], len(offsets)
+
+# Keeps recently viewed records parsed for Prev/Next browsing; grades are
+# looked up separately, so saving a grade never makes an entry stale
+@lru_cache(maxsize=256)
+def read_example(idx):
+    n = bisect_right(shard_starts, idx) - 1
+    shard = shards[n]
+    with data_lock:
+        if shard["file"] is None:
+            shard["file"], shard["offsets"] = index_shard(shard["path"])
+        shard["file"].seek(shard["offsets"][idx - shard_starts[n]])
+        line = shard["file"].readline()
+    return loads(line)
 
 def load_existing_grades():
-    if not os.path.exists(GRADES_PATH):
+    """Read the grades log, keeping the last grade per prompt.
+
+    save_grade only ever appends, so the log is compacted here on startup
+    once it holds superseded entries. The log is mapped rather than read so
+    lines are parsed straight out of the page cache.
+    """
+    if not os.path.exists(GRADES_PATH) or os.path.getsize(GRADES_PATH) == 0:
         return {}
-    grades = {}
-    with open(GRADES_PATH, "r", encoding="utf-8") as f:
-        for line in f:
+    records = {}
+    entries = 0
+    with open(GRADES_PATH, "rb") as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        readline = mm.readline
+        while line := readline():
             try:
-                item = json.loads(line)
-                grades[item["prompt"]] = item["grade"]
+                item = loads(line)
+                records[item["prompt"]] = item
             except:
                 continue
-    return grades
+            entries += 1
+    if entries > len(records):
+        compact_grades(records.values())
+    return {prompt: item["grade"] for prompt, item in records.items()}
+
+def compact_grades(records):
+    tmp_path = GRADES_PATH + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(b"".join(dump_line(item) for item in records))
+    os.replace(tmp_path, GRADES_PATH)
+
+def open_grades_log():
+    """Open the grades log for appending, creating its directory if needed.
+
+    Called on the main thread, so a missing directory or bad permissions
+    fail at startup rather than inside the flusher. The handle is unbuffered:
+    each batch goes out in one write, and a failed write leaves nothing
+    behind in a buffer to be written twice.
+    """
+    os.makedirs(os.path.dirname(GRADES_PATH), exist_ok=True)
+    return open(GRADES_PATH, "ab", buffering=0)
+
+def flush_grades(f):
+    """Append queued grade lines to the log, batching whatever has piled up.
+
+    Runs on a background thread so clicks never wait on disk; a None entry
+    stops it once everything queued before it is written. A failed write is
+    kept in flush_error for save_grade to report, and the unwritten bytes are
+    retried with the next batch.
+    """
+    global flush_error
+    pending = b""
+    with f:
+        while True:
+            batch = [grade_queue.get()]
+            while True:
+                try:
+                    batch.append(grade_queue.get_nowait())
+                except queue.Empty:
+                    break
+            pending += b"".join(line for line in batch if line is not None)
+            try:
+                # Raw writes may be partial; skip past what landed so a retry
+                # never repeats or splits a line
+                while pending:
+                    pending = pending[f.write(pending):]
+                flush_error = None
+            except OSError as e:
+                flush_error = e
+            if None in batch:
+                if pending:
+                    print(f"Warning: {len(pending)} bytes of grades were not written "
+                          f"to {GRADES_PATH}: {flush_error}")
+                return
+
+def stop_flusher():
+    grade_queue.put(None)
+    flusher.join()
 
 # Global state
-data = load_data()
+shards, shard_starts, total = load_data()
+data_lock = threading.Lock()
 grades = load_existing_grades()
+grade_queue = queue.Queue()
+flush_error = None
+flusher = threading.Thread(target=flush_grades, args=(open_grades_log(),), daemon=True)
+flusher.start()
+atexit.register(stop_flusher)
 
 def get_example(idx):
-    if not data:
+    if not total:
         return "No data found", "Please ensure data/samples.jsonl exists.", "N/A", idx
-    idx = max(0, min(int(idx), len(data) - 1))
-    item = data[idx]
+    idx = max(0, min(int(idx), total - 1))
+    item = read_example(idx)
     grade = grades.get(item["prompt"], "Not Graded")
     return item["prompt"], item["response"], f"Grade: {grade}", idx
 
 def save_grade(idx, grade_val):
-    if not data: return get_example(idx)
-    item = data[idx]
+    if not total: return get_example(idx)
+    item = read_example(idx)
+    # Re-clicking the current grade leaves nothing to record
+    if grades.get(item["prompt"]) == grade_val:
+        return get_example(idx)
     grades[item["prompt"]] = grade_val
-    
-    # Save all grades back to JSONL
-    with open(GRADES_PATH, "w", encoding="utf-8") as f:
-        for prompt, g in grades.items():
-            # Find the original response
-            orig_resp = next((d["response"] for d in data if d["prompt"] == prompt), "")
-            f.write(json.dumps({"prompt": prompt, "response": orig_resp, "grade": g}) + "\n")
-            
+
+    # Queued for the flusher thread; older entries for this prompt are
+    # dropped when the log is compacted on the next startup
+    line = dump_line({"prompt": item["prompt"], "response": item["response"], "grade": grade_val})
+    if flusher.is_alive():
+        grade_queue.put(line)
+    else:
+        # The flusher is gone; append directly so any error reaches the UI
+        with open(GRADES_PATH, "ab") as f:
+            f.write(line)
+    if flush_error is not None:
+        raise gr.Error(f"Grades are not reaching {GRADES_PATH} ({flush_error}); "
+                       "they will be retried on the next save.")
+
     return get_example(idx)
 
 # UI Definition
@@ -64,7 +225,7 @@ with gr.Blocks(theme=gr.themes.Soft(), title="AHK v2 Finetune Grader") as demo:
             status_label = gr.Label(value="Status: Ready")
             grade_display = gr.Markdown("### Grade: Not Graded")
             index_num = gr.Number(value=0, label="Current Index", precision=0)
-            progress_bar = gr.Markdown(f"Total Examples: {len(data)}")
+            progress_bar = gr.Markdown(f"Total Examples: {total}")
 
     with gr.Row():
         btn_good = gr.Button("✅ Mark Good", variant="primary")
@@ -0,0 +1,44 @@
+"""Directory walking shared by the snippet maintenance scripts."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import AbstractSet, Iterator
+
+
+def sorted_dir_entries(path: str | Path) -> list[os.DirEntry[str]]:
+    """List a directory in the order sorted() gives its Paths, or [] if unreadable."""
+    try:
+        with os.scandir(path) as it:
+            # normcase matches Path ordering: case-insensitive on Windows.
+            return sorted(it, key=lambda e: os.path.normcase(e.name))
+    except OSError:
+        return []
+
+
+def iter_ahk_files(root: str | Path, *, skip_dirs: AbstractSet[str] = frozenset()) -> Iterator[str]:
+    """Yield .ahk file paths under root in the order of sorted(root.rglob("*.ahk")).
+
+    Walks depth-first with os.scandir, visiting each directory's entries in
+    name order, so file/dir checks come from the listing itself and only one
+    directory listing per level is held at a time. Directories named in
+    ``skip_dirs`` are not entered, and nothing is yielded if root lies inside
+    one. Paths are yielded as the plain strings scandir produces; wrap them in
+    Path only where needed.
+    """
+    if skip_dirs and not skip_dirs.isdisjoint(Path(root).parts):
+        return
+    stack = [iter(sorted_dir_entries(root))]
+    while stack:
+        entry = next(stack[-1], None)
+        if entry is None:
+            stack.pop()
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name not in skip_dirs:
+                stack.append(iter(sorted_dir_entries(entry.path)))
+            continue
+        # Skip symlinks to directories and other non-files.
+        if os.path.normcase(entry.name).endswith(".ahk") and entry.is_file():
+            yield entry.path
@@ -24,15 +24,27 @@ Examples:
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import mmap
+import os
+import queue
 import subprocess
 import sys
-from dataclasses import asdict, dataclass
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Iterable, Iterator, Literal
+from typing import Callable, Iterable, Literal
 
 import re
 
+if __package__:
+    from .ahk_files import iter_ahk_files
+else:
+    from ahk_files import iter_ahk_files
+
 UTF8_BOM = b"\xef\xbb\xbf"
 
 IS_WINDOWS = sys.platform.startswith("win")
@@ -42,6 +54,129 @@ NODE_CMD = "node.exe" if IS_WINDOWS else "node"
 RE_REQUIRES_V2 = re.compile(r"^\s*#requires\s+autohotkey\s+v2", re.IGNORECASE)
 RE_SINGLE_INSTANCE = re.compile(r"^\s*#singleinstance\b", re.IGNORECASE)
 RE_INCLUDE = re.compile(r"^\s*#include\b", re.IGNORECASE)
+# All three in one pattern, so a per-line scan tests the shared "^\s*#" prefix
+# once and reads the kind of directive from m.lastgroup.
+RE_DIRECTIVE = re.compile(
+    r"^\s*#(?:(?P<req>requires\s+autohotkey\s+v2)|(?P<si>singleinstance\b)|(?P<inc>include\b))",
+    re.IGNORECASE,
+)
+
+# Bound once so per-line loops skip the attribute lookup.
+match_requires_v2 = RE_REQUIRES_V2.match
+match_single_instance = RE_SINGLE_INSTANCE.match
+match_directive = RE_DIRECTIVE.match
+
+RE_LEADING_WS = re.compile(r"^(\s*)")
+# The upstream cli.ts line that patch_thqby_cli_ts rewrites.
+THQBY_SPLIT_LINE = "const arr = s.split('=');"
+
+# Files larger than this are mapped instead of read into a bytes copy.
+MMAP_THRESHOLD = 1 << 16
+
+# Never walked, so editor history snapshots aren't scanned by accident.
+SKIP_DIRS = frozenset({".git", ".history", ".local-history"})
+
+# Below this many files, pool startup costs more than it saves.
+MIN_PARALLEL_FILES = 64
+
+# Upper bound on concurrent THQBY node processes.
+MAX_THQBY_DAEMONS = 8
+
+# Results of the text pass per file, reused while (mtime, size) are unchanged.
+RESULT_CACHE_PATH = Path(".cache") / "format_ahk_examples" / "index.json"
+
+# Driver installed next to the THQBY cli.js: compiles the bundle once and runs
+# it per request read from stdin (one JSON object per line), replying with one
+# JSON line per request. This saves a node start-up for every formatted file.
+THQBY_BATCH_JS = r"""'use strict';
+const fs = require('fs');
+const path = require('path');
+const readline = require('readline');
+const vm = require('vm');
+const Module = require('module');
+
+class CliExit extends Error {
+  constructor(code) {
+    super(`cli exited with code ${code}`);
+    this.code = code;
+  }
+}
+
+const cliPath = path.resolve(process.argv[2]);
+const source = fs.readFileSync(cliPath, 'utf8').replace(/^#!.*/, '');
+const runCli = vm.runInThisContext(
+  '(function (exports, require, module, __filename, __dirname, process, console) {' + source + '\n})',
+  { filename: cliPath },
+);
+const cliRequire = Module.createRequire(cliPath);
+
+// Serve the request's text for its own path so the CLI does not read the
+// file back from disk; everything else goes to the real fs.
+function textFs(file, text) {
+  const target = path.resolve(file);
+  const isTarget = (p) => typeof p === 'string' && path.resolve(p) === target;
+  return Object.assign(Object.create(fs), {
+    existsSync: (p) => isTarget(p) || fs.existsSync(p),
+    readFileSync: (p, options) => {
+      if (!isTarget(p)) return fs.readFileSync(p, options);
+      const encoding = typeof options === 'string' ? options : options && options.encoding;
+      const buf = Buffer.from(text, 'utf8');
+      return encoding ? buf.toString(encoding) : buf;
+    },
+  });
+}
+
+async function formatFile(file, indent, text) {
+  let require = cliRequire;
+  if (typeof text === 'string') {
+    const cliFs = textFs(file, text);
+    require = Object.assign(
+      (id) => (id === 'fs' || id === 'node:fs' ? cliFs : cliRequire(id)),
+      cliRequire,
+    );
+  }
+  let output = '';
+  const capture = (...args) => { output += args.join(' ') + '\n'; };
+  const cliConsole = Object.assign(Object.create(console), { log: capture, info: capture });
+  // process.stdout is a getter on the real process, so shadow via descriptors.
+  const cliProcess = Object.create(process, {
+    argv: { value: [process.argv[0], cliPath, `path=${file}`, `indent_string=${indent}`] },
+    exit: { value: (code) => { throw new CliExit(code || 0); } },
+    stdout: {
+      value: Object.assign(Object.create(process.stdout), {
+        write: (chunk) => { output += String(chunk); return true; },
+      }),
+    },
+  });
+  const mod = { exports: {} };
+  try {
+    runCli.call(mod.exports, mod.exports, require, mod, cliPath, path.dirname(cliPath), cliProcess, cliConsole);
+  } catch (err) {
+    if (!(err instanceof CliExit && err.code === 0)) throw err;
+  }
+  // Let any output scheduled by the CLI land before replying.
+  await new Promise(setImmediate);
+  return output;
+}
+
+async function main() {
+  process.stdout.write(JSON.stringify({ ready: true }) + '\n');
+  const rl = readline.createInterface({ input: process.stdin, crlfDelay: Infinity });
+  for await (const line of rl) {
+    if (!line) continue;
+    const req = JSON.parse(line);
+    let reply;
+    try {
+      reply = { output: await formatFile(req.path, req.indent, req.text) };
+    } catch (err) {
+      reply = { error: String(err && err.stack || err) };
+    }
+    process.stdout.write(JSON.stringify(reply) + '\n');
+  }
+}
+
+main();
+"""
 
 
 Severity = Literal["error", "warning"]
@@ -55,6 +190,16 @@ class Finding:
     message: str
     line: int | None = None
 
+    def as_dict(self) -> dict:
+        # Same shape as dataclasses.asdict(), without its per-field deepcopy.
+        return {
+            "path": self.path,
+            "severity": self.severity,
+            "code": self.code,
+            "message": self.message,
+            "line": self.line,
+        }
+
 
 @dataclass(frozen=True)
 class FileResult:
@@ -62,6 +207,13 @@ class FileResult:
     changed: bool
     findings: list[Finding]
 
+    def as_dict(self) -> dict:
+        return {
+            "path": self.path,
+            "changed": self.changed,
+            "findings": [finding.as_dict() for finding in self.findings],
+        }
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -126,6 +278,12 @@ def parse_args() -> argparse.Namespace:
         type=Path,
         help="Optional path to write a JSON report.",
     )
+    parser.add_argument(
+        "--json-report-format",
+        choices=("ndjson", "pretty"),
+        default="ndjson",
+        help="JSON report layout: one object per file per line, or one indented array (default: ndjson).",
+    )
     parser.add_argument(
         "--show",
         type=int,
@@ -137,27 +295,52 @@ def parse_args() -> argparse.Namespace:
         type=int,
         help="Optional max number of files to process.",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Re-scan every file instead of reusing results from {RESULT_CACHE_PATH}.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker count for checks/fixes and the THQBY pass (default: CPU count).",
+    )
     return parser.parse_args()
 
 
-def iter_ahk_files(root: Path) -> Iterator[Path]:
-    for path in sorted(root.rglob("*.ahk")):
-        # Keep tooling deterministic; skip non-files.
-        if not path.is_file():
-            continue
-        # Avoid accidental scans of editor history snapshots.
-        if any(part in {".git", ".history", ".local-history"} for part in path.parts):
-            continue
-        yield path
-
-
 def detect_newline_policy(raw: bytes) -> str:
     if b"\r\n" in raw:
         return "\r\n"
     return "\n"
 
 
+def decode_source(raw: bytes | mmap.mmap) -> tuple[bool, bool, str]:
+    has_crlf = raw.find(b"\r\n") != -1
+    had_bom = raw[: len(UTF8_BOM)] == UTF8_BOM
+    # Decode through a memoryview so neither the BOM strip nor a mapped file
+    # needs a bytes copy.
+    with memoryview(raw) as view, view[len(UTF8_BOM) if had_bom else 0 :] as body:
+        text = str(body, "utf-8")
+    return has_crlf, had_bom, text
+
+
+def read_source(path: str | Path) -> tuple[bool, bool, str]:
+    """Read an example as UTF-8, returning ``(has_crlf, had_bom, text)``.
+
+    Raises UnicodeDecodeError for undecodable files. The mapping of a large
+    file is closed before returning, so callers may rewrite the file.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size <= MMAP_THRESHOLD:
+            return decode_source(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return decode_source(mm)
+
+
 def normalize_newlines(text: str, newline: str) -> str:
+    if newline == "\n" and "\r" not in text:
+        return text
     normalized = text.replace("\r\n", "\n").replace("\r", "\n")
     if newline == "\n":
         return normalized
@@ -207,35 +390,38 @@ def patch_thqby_cli_ts(repo_dir: Path) -> bool:
         return False
 
     text = cli_ts.read_text(encoding="utf-8", errors="replace")
-    if "s.split('='')" not in text:
+    # Already patched (every run after the first build): skip the line split.
+    if THQBY_SPLIT_LINE not in text:
         return False
 
     lines = text.splitlines(keepends=True)
     patched = False
     for idx, line in enumerate(lines):
-        if "const arr = s.split('=');" not in line:
+        if THQBY_SPLIT_LINE not in line:
             continue
         newline = "\r\n" if line.endswith("\r\n") else "\n"
-        indent = re.match(r"^(\s*)", line).group(1) if re.match(r"^(\s*)", line) else ""
+        m = RE_LEADING_WS.match(line)
+        indent = m.group(1) if m else ""
         indent2 = indent + ("    " if "\t" not in indent else "\t")
         replacement = [
             f"{indent}const eq = s.indexOf('=');{newline}",
             f"{indent}if (eq <= 0){newline}",
             f"{indent2}return;{newline}",
             f"{indent}const key = s.slice(0, eq);{newline}",
-            r"{indent}const value = s.slice(eq + 1).replace(/^([\'\"])(.*)\\1$/, \'$2\');{newline}",
+            f"{indent}const value = s.slice(eq + 1).replace(/^(['\"])(.*)\\1$/, '$2');{newline}",
             f"{indent}options[key] = value;{newline}",
         ]
         # Replace the `const arr ...` line and the next `options[arr[0]] ...` line.
         end = idx + 2 if idx + 1 < len(lines) else idx + 1
-        lines[idx:end] = replacement
         patched = True
         break
 
     if not patched:
         return False
 
-    cli_ts.write_text("".join(lines), encoding="utf-8", newline="")
+    cli_ts.write_text(
+        "".join([*lines[:idx], *replacement, *lines[end:]]), encoding="utf-8", newline=""
+    )
     return True
 
 
@@ -279,7 +465,8 @@ def ensure_thqby_cli(cache_dir: Path, *, allow_bootstrap: bool) -> Path:
 
 
 def thqby_format_file(cli_js: Path, file_path: Path, *, indent: str) -> str:
-    # Pass args as a list to preserve literal spaces in indent_string.
+    # The CLI reads the file itself. Pass args as a list to preserve literal
+    # spaces in indent_string.
     cli_js_abs = cli_js.resolve()
     file_abs = file_path.resolve()
     result = run_cmd(
@@ -291,6 +478,125 @@ def thqby_format_file(cli_js: Path, file_path: Path, *, indent: str) -> str:
     return result.stdout or ""
 
 
+def install_thqby_batch_js(cli_js: Path) -> Path:
+    batch_js = cli_js.with_name("cli_batch.js")
+    if not batch_js.exists() or batch_js.read_text(encoding="utf-8") != THQBY_BATCH_JS:
+        batch_js.write_text(THQBY_BATCH_JS, encoding="utf-8", newline="\n")
+    return batch_js
+
+
+class ThqbyDaemon:
+    """A long-lived node process formatting files through cli_batch.js.
+
+    Requests are written to its stdin and answered in order on its stdout, so
+    a lock keeps each request/reply pair together across threads.
+    """
+
+    def __init__(self, cli_js: Path) -> None:
+        batch_js = install_thqby_batch_js(cli_js)
+        self.proc = subprocess.Popen(
+            [NODE_CMD, str(batch_js.resolve()), str(cli_js.resolve())],
+            cwd=str(cli_js.parent),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+        )
+        self.lock = threading.Lock()
+        try:
+            ready = json.loads(self.proc.stdout.readline() or "{}")
+        except ValueError:
+            ready = {}
+        if not ready.get("ready"):
+            self.close()
+            raise RuntimeError(f"THQBY batch formatter did not start: {batch_js}")
+
+    def format(self, file_path: Path, *, indent: str, text: str | None = None) -> str:
+        """Format ``file_path``; when ``text`` is given node uses it instead of the file."""
+        payload = {"path": str(file_path.resolve()), "indent": indent}
+        if text is not None:
+            payload["text"] = text
+        request = json.dumps(payload)
+        with self.lock:
+            try:
+                self.proc.stdin.write(request + "\n")
+                self.proc.stdin.flush()
+                line = self.proc.stdout.readline()
+            except OSError as exc:
+                raise RuntimeError(f"THQBY batch formatter failed: {exc}") from exc
+        if not line:
+            # stdout closed: reap the process so poll() reports it as gone.
+            try:
+                self.proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+                self.proc.wait()
+            raise RuntimeError("THQBY batch formatter exited unexpectedly.")
+        reply = json.loads(line)
+        if "error" in reply:
+            raise RuntimeError(f"THQBY format failed for {file_path}:\n{reply['error']}")
+        return reply["output"]
+
+    def close(self) -> None:
+        if self.proc.stdin:
+            try:
+                self.proc.stdin.close()
+            except OSError:
+                pass  # the process already exited
+        try:
+            self.proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+            self.proc.wait()
+
+
+class ThqbyDaemonPool:
+    """Several ThqbyDaemon processes shared by the THQBY worker threads.
+
+    Each request borrows an idle daemon from a queue and hands it back when
+    done, so at most ``size`` node processes ever run at once. A daemon found
+    dead on checkout is replaced first; if that fails the slot goes back
+    empty, so the next request tries again instead of reusing the dead one.
+    """
+
+    def __init__(self, cli_js: Path, size: int) -> None:
+        self.cli_js = cli_js
+        self.daemons: list[ThqbyDaemon] = []
+        try:
+            for _ in range(size):
+                self.daemons.append(ThqbyDaemon(cli_js))
+        except (OSError, RuntimeError):
+            self.close()
+            raise
+        self.idle: queue.Queue[ThqbyDaemon | None] = queue.Queue()
+        for daemon in self.daemons:
+            self.idle.put(daemon)
+
+    def format(self, file_path: Path, *, indent: str, text: str | None = None) -> str:
+        daemon = self.idle.get()
+        try:
+            if daemon is None or daemon.proc.poll() is not None:
+                daemon = None  # a failed respawn hands back an empty slot
+                daemon = self._respawn()
+            return daemon.format(file_path, indent=indent, text=text)
+        finally:
+            self.idle.put(daemon)
+
+    def _respawn(self) -> ThqbyDaemon:
+        try:
+            daemon = ThqbyDaemon(self.cli_js)
+        except OSError as exc:
+            raise RuntimeError(f"THQBY batch formatter could not be restarted: {exc}") from exc
+        self.daemons.append(daemon)
+        return daemon
+
+    def close(self) -> None:
+        for daemon in self.daemons:
+            daemon.close()
+
+
 def find_header_end(lines: list[str]) -> int:
     """Heuristic: header ends at first non-comment, non-directive code line."""
     in_block_comment = False
@@ -337,26 +643,99 @@ def find_comment_prefix_end(lines: list[str]) -> int:
     return len(lines)
 
 
-def first_non_comment_line(lines: list[str]) -> str:
-    idx = find_comment_prefix_end(lines)
+def scan_lines(lines: list[str]) -> tuple[bool, list[int], list[int], int, int]:
+    """Collect everything the checks need from one pass over ``lines``.
+
+    Returns ``(has_requires, singleinstance_lines, trailing_ws_lines,
+    prefix_end, header_end)``: 1-based line numbers of ``#SingleInstance``
+    directives and of lines with trailing whitespace, and the indexes that
+    ``find_comment_prefix_end`` and ``find_header_end`` would return.
+    """
+    has_requires = False
+    singleinstance_lines: list[int] = []
+    # Collected in a comprehension, so the per-line endswith test runs
+    # outside the main loop.
+    trailing_ws_lines = [
+        line_no for line_no, line in enumerate(lines, start=1) if line.endswith((" ", "\t"))
+    ]
+    prefix_end = header_end = -1
+    in_block_comment = False
+    for line_no, line in enumerate(lines, start=1):
+        # Both boundaries share the comment state; the header also runs on
+        # past directive lines.
+        if header_end < 0:
+            stripped = line.lstrip()
+            if in_block_comment:
+                if "*/" in stripped:
+                    in_block_comment = False
+            elif stripped and not stripped.startswith(";"):
+                if stripped.startswith("/*"):
+                    in_block_comment = True
+                else:
+                    if prefix_end < 0:
+                        prefix_end = line_no - 1
+                    if not stripped.startswith("#"):
+                        header_end = line_no - 1
+        # Directives need a '#'; the substring test is far cheaper than a match.
+        if "#" in line:
+            m = match_directive(line)
+            if m:
+                kind = m.lastgroup
+                if kind == "req":
+                    has_requires = True
+                elif kind == "si":
+                    singleinstance_lines.append(line_no)
+    if prefix_end < 0:
+        prefix_end = len(lines)
+    if header_end < 0:
+        header_end = len(lines)
+    return has_requires, singleinstance_lines, trailing_ws_lines, prefix_end, header_end
+
+
+def first_non_comment_line(lines: list[str], prefix_end: int | None = None) -> str:
+    idx = find_comment_prefix_end(lines) if prefix_end is None else prefix_end
     for line in lines[idx:]:
         if line.strip():
             return line
     return ""
 
 
-def reorder_header(lines: list[str]) -> list[str]:
-    header_end = find_header_end(lines)
+def reorder_header(
+    lines: list[str],
+    header_end: int | None = None,
+    prefix_end: int | None = None,
+) -> list[str]:
+    """Move #Requires, #SingleInstance and #Include to the top of the header.
+
+    ``header_end``/``prefix_end`` can be passed when already known from
+    ``scan_lines`` to skip walking the header again.
+    """
+    if header_end is None:
+        header_end = find_header_end(lines)
     header = lines[:header_end]
     rest = lines[header_end:]
 
-    prefix_end = find_comment_prefix_end(header)
+    if prefix_end is None:
+        prefix_end = find_comment_prefix_end(header)
     prefix = header[:prefix_end]
     reorderable = header[prefix_end:]
 
-    requires_idx = next((i for i, l in enumerate(reorderable) if RE_REQUIRES_V2.match(l)), None)
-    single_idx = next((i for i, l in enumerate(reorderable) if RE_SINGLE_INSTANCE.match(l)), None)
-    include_idxs = [i for i, l in enumerate(reorderable) if RE_INCLUDE.match(l)]
+    requires_idx: int | None = None
+    single_idx: int | None = None
+    include_idxs: list[int] = []
+    for i, line in enumerate(reorderable):
+        m = match_directive(line)
+        if not m:
+            continue
+        kind = m.lastgroup
+        if kind == "req":
+            if requires_idx is None:
+                requires_idx = i
+        elif kind == "si":
+            if single_idx is None:
+                single_idx = i
+        else:
+            include_idxs.append(i)
 
     moved: set[int] = set()
     new_header: list[str] = []
@@ -387,7 +766,7 @@ def split_singleinstance_inline_hotkey(lines: list[str]) -> tuple[list[str], boo
     changed = False
     updated: list[str] = []
     for line in lines:
-        if not RE_SINGLE_INSTANCE.match(line):
+        if not match_single_instance(line):
             updated.append(line)
             continue
         before_comment = line.split(";", 1)[0]
@@ -413,87 +792,83 @@ def split_singleinstance_inline_hotkey(lines: list[str]) -> tuple[list[str], boo
 
 
 def apply_text_fixes(
-    path: Path,
+    path: str | Path,
     *,
     line_endings: Literal["preserve", "lf", "crlf"],
 ) -> FileResult:
+    path_str = os.fspath(path)
     findings: list[Finding] = []
-    raw = path.read_bytes()
+    try:
+        has_crlf, had_bom, text = read_source(path)
+    except UnicodeDecodeError as exc:
+        return FileResult(
+            path=path_str,
+            changed=False,
+            findings=[
+                Finding(
+                    path=path_str,
+                    severity="error",
+                    code="utf8_decode",
+                    message=f"Cannot decode as UTF-8: {exc}",
+                )
+            ],
+        )
 
-    newline = detect_newline_policy(raw)
+    newline = "\r\n" if has_crlf else "\n"
     if line_endings == "lf":
         newline = "\n"
     elif line_endings == "crlf":
         newline = "\r\n"
 
-    had_bom = raw.startswith(UTF8_BOM)
     if had_bom:
         findings.append(
             Finding(
-                path=str(path),
+                path=path_str,
                 severity="warning",
                 code="utf8_bom",
                 message="UTF-8 BOM present (prefer UTF-8 without BOM).",
             )
         )
-        raw = raw[len(UTF8_BOM) :]
-
-    try:
-        text = raw.decode("utf-8")
-    except UnicodeDecodeError as exc:
-        return FileResult(
-            path=str(path),
-            changed=False,
-            findings=[
-                Finding(
-                    path=str(path),
-                    severity="error",
-                    code="utf8_decode",
-                    message=f"Cannot decode as UTF-8: {exc}",
-                )
-            ],
-        )
 
     normalized = normalize_newlines(text, "\n")
     lines = normalized.split("\n")
 
-    has_requires = any(RE_REQUIRES_V2.match(line) for line in lines)
+    has_requires, singleinstance_lines, trailing_ws_lines, prefix_end, header_end = scan_lines(lines)
     if not has_requires:
         findings.append(
             Finding(
-                path=str(path),
+                path=path_str,
                 severity="error",
                 code="missing_requires",
                 message="Missing '#Requires AutoHotkey v2...' directive.",
             )
         )
     else:
-        first_stmt = first_non_comment_line(lines)
-        if first_stmt and not RE_REQUIRES_V2.match(first_stmt):
+        first_stmt = first_non_comment_line(lines, prefix_end)
+        if first_stmt and not match_requires_v2(first_stmt):
             findings.append(
                 Finding(
-                    path=str(path),
+                    path=path_str,
                     severity="warning",
                     code="requires_not_first",
                     message="First non-comment line is not '#Requires AutoHotkey v2...'.",
                 )
             )
 
-    if not any(RE_SINGLE_INSTANCE.match(line) for line in lines):
+    if not singleinstance_lines:
         findings.append(
             Finding(
-                path=str(path),
+                path=path_str,
                 severity="warning",
                 code="missing_singleinstance",
                 message="Missing '#SingleInstance ...' (recommended for runnable examples).",
             )
         )
 
-    trailing_ws_lines = [i + 1 for i, line in enumerate(lines) if line.endswith((" ", "\t"))]
     for line_no in trailing_ws_lines[:50]:
         findings.append(
             Finding(
-                path=str(path),
+                path=path_str,
                 severity="warning",
                 code="trailing_whitespace",
                 message="Trailing whitespace.",
@@ -503,7 +878,7 @@ def apply_text_fixes(
     if len(trailing_ws_lines) > 50:
         findings.append(
             Finding(
-                path=str(path),
+                path=path_str,
                 severity="warning",
                 code="trailing_whitespace",
                 message=f"Trailing whitespace (and {len(trailing_ws_lines) - 50} more lines).",
@@ -514,17 +889,33 @@ def apply_text_fixes(
     if needs_final_newline:
         findings.append(
             Finding(
-                path=str(path),
+                path=path_str,
                 severity="warning",
                 code="missing_final_newline",
                 message="File does not end with a newline.",
             )
         )
 
-    # Fixes
+    # Fixes. Most files need none: with no BOM, trailing whitespace, missing
+    # final newline, inline hotkey or header reordering, the rebuilt text
+    # would equal the original, so skip building and comparing it.
+    if (
+        not had_bom
+        and not trailing_ws_lines
+        and not needs_final_newline
+        and not any("::" in lines[n - 1].split(";", 1)[0] for n in singleinstance_lines)
+        and reorder_header(lines, header_end, prefix_end) == lines
+    ):
+        return FileResult(path=path_str, changed=False, findings=findings)
+
     fixed_lines = [line.rstrip(" \t") for line in lines]
     fixed_lines, split_changed = split_singleinstance_inline_hotkey(fixed_lines)
-    fixed_lines = reorder_header(fixed_lines)
+    # Stripping trailing whitespace keeps the header boundaries; splitting a
+    # line does not, so re-walk the header in that case.
+    if split_changed:
+        fixed_lines = reorder_header(fixed_lines)
+    else:
+        fixed_lines = reorder_header(fixed_lines, header_end, prefix_end)
     fixed_text = "\n".join(fixed_lines)
     if needs_final_newline:
         fixed_text += "\n"
@@ -535,34 +926,23 @@ def apply_text_fixes(
 
     changed = had_bom or split_changed or fixed_text != normalize_newlines(text, newline)
     if changed:
-        path.write_text(fixed_text, encoding="utf-8", newline="")
-    return FileResult(path=str(path), changed=changed, findings=findings)
+        with open(path_str, "w", encoding="utf-8", newline="") as f:
+            f.write(fixed_text)
+    return FileResult(path=path_str, changed=changed, findings=findings)
 
 
-def check_only(path: Path) -> FileResult:
-    raw = path.read_bytes()
+def check_only(path: str | Path) -> FileResult:
+    path_str = os.fspath(path)
     findings: list[Finding] = []
-
-    if raw.startswith(UTF8_BOM):
-        findings.append(
-            Finding(
-                path=str(path),
-                severity="warning",
-                code="utf8_bom",
-                message="UTF-8 BOM present (prefer UTF-8 without BOM).",
-            )
-        )
-        raw = raw[len(UTF8_BOM) :]
-
     try:
-        text = raw.decode("utf-8")
+        _, had_bom, text = read_source(path)
     except UnicodeDecodeError as exc:
         return FileResult(
-            path=str(path),
+            path=path_str,
             changed=False,
             findings=[
                 Finding(
-                    path=str(path),
+                    path=path_str,
                     severity="error",
                     code="utf8_decode",
                     message=f"Cannot decode as UTF-8: {exc}",
@@ -570,45 +950,54 @@ def check_only(path: Path) -> FileResult:
             ],
         )
 
+    if had_bom:
+        findings.append(
+            Finding(
+                path=path_str,
+                severity="warning",
+                code="utf8_bom",
+                message="UTF-8 BOM present (prefer UTF-8 without BOM).",
+            )
+        )
+
     lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
 
-    has_requires = any(RE_REQUIRES_V2.match(line) for line in lines)
+    has_requires, singleinstance_lines, trailing_ws_lines, prefix_end, _ = scan_lines(lines)
     if not has_requires:
         findings.append(
             Finding(
-                path=str(path),
+                path=path_str,
                 severity="error",
                 code="missing_requires",
                 message="Missing '#Requires AutoHotkey v2...' directive.",
             )
         )
     else:
-        first_stmt = first_non_comment_line(lines)
-        if first_stmt and not RE_REQUIRES_V2.match(first_stmt):
+        first_stmt = first_non_comment_line(lines, prefix_end)
+        if first_stmt and not match_requires_v2(first_stmt):
             findings.append(
                 Finding(
-                    path=str(path),
+                    path=path_str,
                     severity="warning",
                     code="requires_not_first",
                     message="First non-comment line is not '#Requires AutoHotkey v2...'.",
                 )
             )
 
-    if not any(RE_SINGLE_INSTANCE.match(line) for line in lines):
+    if not singleinstance_lines:
         findings.append(
             Finding(
-                path=str(path),
+                path=path_str,
                 severity="warning",
                 code="missing_singleinstance",
                 message="Missing '#SingleInstance ...' (recommended for runnable examples).",
             )
         )
 
-    trailing_ws_lines = [i + 1 for i, line in enumerate(lines) if line.endswith((" ", "\t"))]
     for line_no in trailing_ws_lines[:50]:
         findings.append(
             Finding(
-                path=str(path),
+                path=path_str,
                 severity="warning",
                 code="trailing_whitespace",
                 message="Trailing whitespace.",
@@ -618,7 +1007,7 @@ def check_only(path: Path) -> FileResult:
     if len(trailing_ws_lines) > 50:
         findings.append(
             Finding(
-                path=str(path),
+                path=path_str,
                 severity="warning",
                 code="trailing_whitespace",
                 message=f"Trailing whitespace (and {len(trailing_ws_lines) - 50} more lines).",
@@ -628,20 +1017,19 @@ def check_only(path: Path) -> FileResult:
     if not text.endswith(("\n", "\r\n", "\r")):
         findings.append(
             Finding(
-                path=str(path),
+                path=path_str,
                 severity="warning",
                 code="missing_final_newline",
                 message="File does not end with a newline.",
             )
         )
 
-    for line_no, line in enumerate(lines, start=1):
-        if not RE_SINGLE_INSTANCE.match(line):
-            continue
+    for line_no in singleinstance_lines:
+        line = lines[line_no - 1]
         if "::" in line.split(";", 1)[0]:
             findings.append(
                 Finding(
-                    path=str(path),
+                    path=path_str,
                     severity="warning",
                     code="singleinstance_inline_hotkey",
                     message="Line mixes '#SingleInstance' with a hotkey/label (split onto separate lines).",
@@ -649,7 +1037,79 @@ def check_only(path: Path) -> FileResult:
                 )
             )
 
-    return FileResult(path=str(path), changed=False, findings=findings)
+    return FileResult(path=path_str, changed=False, findings=findings)
+
+
+def thqby_check_file(
+    item: FileResult,
+    *,
+    format_file: Callable[..., str],
+    fix: bool,
+    indent: str,
+    line_endings: Literal["preserve", "lf", "crlf"],
+    strict_backend: bool,
+) -> FileResult:
+    path = Path(item.path)
+    if not path.exists():
+        return item
+
+    raw = path.read_bytes()
+    newline = detect_newline_policy(raw)
+    if line_endings == "lf":
+        newline = "\n"
+    elif line_endings == "crlf":
+        newline = "\r\n"
+
+    try:
+        # Decoded as node would read it (BOM and CRLF kept), so the formatter
+        # can be handed the text instead of reading the file again.
+        source = raw.decode("utf-8")
+    except UnicodeDecodeError:
+        # Already flagged by main pass.
+        return item
+
+    try:
+        formatted = format_file(path, indent=indent, text=source)
+    except RuntimeError as exc:
+        finding = Finding(
+            path=item.path,
+            severity="error" if strict_backend else "warning",
+            code="thqby_failed",
+            message=truncate_text(str(exc)),
+        )
+        return FileResult(path=item.path, changed=item.changed, findings=[*item.findings, finding])
+
+    # Normalize formatter output (console.log adds a trailing newline).
+    formatted = formatted.replace("\r\n", "\n").replace("\r", "\n")
+    original_text = source.removeprefix("\ufeff").replace("\r\n", "\n").replace("\r", "\n")
+
+    if not formatted.strip() and original_text.strip():
+        finding = Finding(
+            path=item.path,
+            severity="error" if strict_backend else "warning",
+            code="thqby_empty_output",
+            message="THQBY formatter returned empty output; file left unchanged.",
+        )
+        return FileResult(path=item.path, changed=item.changed, findings=[*item.findings, finding])
+
+    if formatted != original_text and formatted.rstrip("\n") != original_text.rstrip("\n"):
+        finding = Finding(
+            path=item.path,
+            severity="warning",
+            code="thqby_diff",
+            message="THQBY formatter would change this file.",
+        )
+        findings = [*item.findings, finding]
+        changed = item.changed
+        if fix:
+            final_text = formatted
+            if not final_text.endswith("\n"):
+                final_text += "\n"
+            final_text = normalize_newlines(final_text, newline)
+            path.write_text(final_text, encoding="utf-8", newline="")
+            changed = True
+        return FileResult(path=item.path, changed=changed, findings=findings)
+    return item
 
 
 def apply_thqby(
@@ -660,96 +1120,116 @@ def apply_thqby(
     indent: str,
     line_endings: Literal["preserve", "lf", "crlf"],
     strict_backend: bool,
+    jobs: int = 1,
 ) -> list[FileResult]:
+    # Prefer a few persistent node processes; fall back to one per file.
+    workers = max(1, jobs)
+    try:
+        daemons: ThqbyDaemonPool | None = ThqbyDaemonPool(
+            cli_js, min(MAX_THQBY_DAEMONS, workers, len(results) or 1)
+        )
+    except (OSError, RuntimeError) as exc:
+        print(f"THQBY batch mode unavailable, formatting one process per file: {exc}")
+        daemons = None
+    if daemons:
+        format_file = daemons.format
+        workers = len(daemons.daemons)
+    else:
+        # A one-shot CLI process can only read the file from disk, so the
+        # already-decoded text the daemons take is not passed on.
+        def format_file(path: Path, *, indent: str, text: str) -> str:
+            return thqby_format_file(cli_js, path, indent=indent)
+
+    check = partial(
+        thqby_check_file,
+        format_file=format_file,
+        fix=fix,
+        indent=indent,
+        line_endings=line_endings,
+        strict_backend=strict_backend,
+    )
     updated: list[FileResult] = []
     total = len(results)
-    for idx, item in enumerate(results, start=1):
-        path = Path(item.path)
-        if not path.exists():
-            updated.append(item)
-            continue
+    # Node does the formatting outside the GIL, so threads are enough to
+    # overlap it with reading and diffing; map() keeps results in input order.
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for idx, result in enumerate(executor.map(check, results), start=1):
+                if idx == 1 or idx % 200 == 0 or idx == total:
+                    print(f"THQBY format pass: {idx}/{total}")
+                updated.append(result)
+    finally:
+        if daemons:
+            daemons.close()
+    return updated
 
-        if idx == 1 or idx % 200 == 0 or idx == total:
-            print(f"THQBY format pass: {idx}/{total}")
 
-        raw = path.read_bytes()
-        newline = detect_newline_policy(raw)
-        if line_endings == "lf":
-            newline = "\n"
-        elif line_endings == "crlf":
-            newline = "\r\n"
+def load_result_cache(path: Path) -> dict[str, dict]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
 
-        try:
-            formatted = thqby_format_file(cli_js, path, indent=indent)
-        except RuntimeError as exc:
-            finding = Finding(
-                path=item.path,
-                severity="error" if strict_backend else "warning",
-                code="thqby_failed",
-                message=truncate_text(str(exc)),
-            )
-            updated.append(
-                FileResult(path=item.path, changed=item.changed, findings=[*item.findings, finding])
-            )
-            continue
 
-        # Normalize formatter output (console.log adds a trailing newline).
-        formatted = formatted.replace("\r\n", "\n").replace("\r", "\n")
-        original = raw
-        if original.startswith(UTF8_BOM):
-            original = original[len(UTF8_BOM) :]
-        try:
-            original_text = original.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
-        except UnicodeDecodeError:
-            # Already flagged by main pass.
-            updated.append(item)
-            continue
+def save_result_cache(path: Path, cache: dict[str, dict]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(cache, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp_path, path)
 
-        if not formatted.strip() and original_text.strip():
-            finding = Finding(
-                path=item.path,
-                severity="error" if strict_backend else "warning",
-                code="thqby_empty_output",
-                message="THQBY formatter returned empty output; file left unchanged.",
-            )
-            updated.append(
-                FileResult(path=item.path, changed=item.changed, findings=[*item.findings, finding])
-            )
-            continue
 
-        if formatted != original_text and formatted.rstrip("\n") != original_text.rstrip("\n"):
-            finding = Finding(
-                path=item.path,
-                severity="warning",
-                code="thqby_diff",
-                message="THQBY formatter would change this file.",
-            )
-            findings = [*item.findings, finding]
-            changed = item.changed
-            if fix:
-                final_text = formatted
-                if not final_text.endswith("\n"):
-                    final_text += "\n"
-                final_text = normalize_newlines(final_text, newline)
-                path.write_text(final_text, encoding="utf-8", newline="")
-                changed = True
-            updated.append(FileResult(path=item.path, changed=changed, findings=findings))
-        else:
-            updated.append(item)
-    return updated
+def cache_entry(result: FileResult, mode: str, stat: os.stat_result, digest: str) -> dict:
+    return {
+        "mode": mode,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "blake2b": digest,
+        "findings": [[f.severity, f.code, f.message, f.line] for f in result.findings],
+    }
 
 
-def write_json_report(path: Path, results: Iterable[FileResult]) -> None:
-    payload = []
-    for result in results:
-        payload.append(
-            {
-                "path": result.path,
-                "changed": result.changed,
-                "findings": [asdict(f) for f in result.findings],
-            }
-        )
+def cached_result(path: str, entry: dict) -> FileResult:
+    findings = [
+        Finding(path=path, severity=severity, code=code, message=message, line=line)
+        for severity, code, message, line in entry["findings"]
+    ]
+    return FileResult(path=path, changed=False, findings=findings)
+
+
+def run_unless_unchanged(
+    path: str,
+    known_digest: str | None,
+    *,
+    worker: Callable[[str], FileResult],
+) -> tuple[FileResult | None, str]:
+    """Run ``worker`` on ``path`` unless its content hash is ``known_digest``.
+
+    Returns ``(result, digest)``; ``result`` is None when the content matches
+    and the cached result still applies (e.g. the file was only touched).
+    """
+    with open(path, "rb") as f:
+        digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+    if digest == known_digest:
+        return None, digest
+    return worker(path), digest
+
+
+def write_json_report(
+    path: Path,
+    results: Iterable[FileResult],
+    *,
+    report_format: Literal["ndjson", "pretty"] = "ndjson",
+) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
+    if report_format == "ndjson":
+        # Stream one line per file instead of building the whole payload.
+        with path.open("w", encoding="utf-8", buffering=1 << 20) as f:
+            for result in results:
+                f.write(json.dumps(result.as_dict(), ensure_ascii=False))
+                f.write("\n")
+        return
+
+    payload = [result.as_dict() for result in results]
     path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
 
 
@@ -761,17 +1241,56 @@ def main() -> None:
     if not args.root.exists():
         raise FileNotFoundError(f"Root directory not found: {args.root}")
 
-    files = list(iter_ahk_files(args.root))
+    files = list(iter_ahk_files(args.root, skip_dirs=SKIP_DIRS))
     if args.limit is not None:
         files = files[: args.limit]
 
-    results: list[FileResult] = []
     if mode_check_only:
-        for path in files:
-            results.append(check_only(path))
+        worker = check_only
     else:
-        for path in files:
-            results.append(apply_text_fixes(path, line_endings=args.line_endings))
+        worker = partial(apply_text_fixes, line_endings=args.line_endings)
+
+    # Files unchanged since a previous run in the same mode reuse its result.
+    mode = "check" if mode_check_only else f"fix:{args.line_endings}"
+    cache = {} if args.no_cache else load_result_cache(RESULT_CACHE_PATH)
+    # Files whose stat changed are still skipped if their content hash is the
+    # same as last time.
+    results: list[FileResult | None] = []
+    pending: list[tuple[int, os.stat_result]] = []
+    known_digests: list[str | None] = []
+    for idx, path in enumerate(files):
+        stat = os.stat(path)
+        entry = cache.get(path)
+        if entry and entry["mode"] != mode:
+            entry = None
+        if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            results.append(cached_result(path, entry))
+        else:
+            results.append(None)
+            pending.append((idx, stat))
+            known_digests.append(entry.get("blake2b") if entry else None)
+
+    # Files are independent; map() keeps results in walk order.
+    run = partial(run_unless_unchanged, worker=worker)
+    todo = [files[idx] for idx, _ in pending]
+    if args.jobs > 1 and len(todo) >= MIN_PARALLEL_FILES:
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            fresh = list(executor.map(run, todo, known_digests, chunksize=32))
+    else:
+        fresh = list(map(run, todo, known_digests))
+
+    for (idx, stat), (result, digest) in zip(pending, fresh):
+        key = files[idx]
+        if result is None:
+            entry = cache[key]
+            entry["mtime_ns"], entry["size"] = stat.st_mtime_ns, stat.st_size
+            result = cached_result(key, entry)
+        elif not result.changed:
+            # A rewritten file gets different findings on its next scan.
+            cache[key] = cache_entry(result, mode, stat, digest)
+        results[idx] = result
+    if not args.no_cache and pending:
+        save_result_cache(RESULT_CACHE_PATH, cache)
 
     if args.thqby:
         cli_js = ensure_thqby_cli(args.cache_dir, allow_bootstrap=not args.no_bootstrap)
@@ -782,6 +1301,7 @@ def main() -> None:
             indent=args.indent,
             line_endings=args.line_endings,
             strict_backend=args.thqby_strict,
+            jobs=args.jobs,
         )
 
     total_findings = sum(len(r.findings) for r in results)
@@ -793,32 +1313,34 @@ def main() -> None:
         f for r in results for f in r.findings if f.severity == "warning"
     ]
 
+    # Collect the summary and emit it with a single write.
+    out: list[str] = []
     if total_findings:
-        print(f"Scanned {len(results)} files: {len(error_findings)} errors, {len(warning_findings)} warnings.")
+        out.append(f"Scanned {len(results)} files: {len(error_findings)} errors, {len(warning_findings)} warnings.")
     else:
-        print(f"Scanned {len(results)} files: no findings.")
+        out.append(f"Scanned {len(results)} files: no findings.")
 
     if args.show:
         error_files = sorted({r.path for r in results if any(f.severity == "error" for f in r.findings)})
         warning_files = sorted({r.path for r in results if any(f.severity == "warning" for f in r.findings)})
         if error_files:
-            print("Error files:")
-            for path in error_files[: args.show]:
-                print(f"  - {path}")
+            out.append("Error files:")
+            out.extend(f"  - {path}" for path in error_files[: args.show])
             if len(error_files) > args.show:
-                print(f"  ... and {len(error_files) - args.show} more")
+                out.append(f"  ... and {len(error_files) - args.show} more")
         if warning_files:
-            print("Warning files:")
-            for path in warning_files[: args.show]:
-                print(f"  - {path}")
+            out.append("Warning files:")
+            out.extend(f"  - {path}" for path in warning_files[: args.show])
             if len(warning_files) > args.show:
-                print(f"  ... and {len(warning_files) - args.show} more")
+                out.append(f"  ... and {len(warning_files) - args.show} more")
 
     if args.fix:
-        print(f"Modified {changed_files} files.")
+        out.append(f"Modified {changed_files} files.")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
     if args.json_report:
-        write_json_report(args.json_report, results)
+        write_json_report(args.json_report, results, report_format=args.json_report_format)
         print(f"Wrote JSON report to {args.json_report}")
 
     exit_code = 0
@@ -7,10 +7,20 @@ This script:
 2. Catalogs existing examples in the repository
 3. Creates a unified metadata database
 4. Generates enriched CSV for dataset building
+
+Usage:
+    python scripts/integrate_scraped_examples.py [--pretty | --no-pretty]
+
+The catalog is written indented by default (--pretty) so the tracked
+data/examples_catalog.json diffs line by line; --no-pretty writes compact JSON.
 """
 
+import argparse
 import json
+import os
 import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Set, Optional
 from dataclasses import dataclass, asdict
@@ -18,7 +28,32 @@ import hashlib
 import csv
 
 
-@dataclass
+WRITE_BUFSIZE = 1 << 20
+UTF8_BOM = b'\xef\xbb\xbf'
+
+# Both patterns start with a literal so the regex engine can skip straight
+# to candidates across the whole text; matches never span a newline, and
+# line_indent_start() checks that only whitespace precedes them.
+INCLUDE_RE = re.compile(r'#(?i:include)[^\S\n]+<([^>\n]+)>')
+HEADER_RE = re.compile(r'; (Title|Category|Description|Library):')
+HEADER_LINES = 20
+
+
+def code_hash_of(data: bytes) -> str:
+    """Short SHA-256 key matching examples to scraped code (16 hex chars)."""
+    # Same as hexdigest()[:16] without hex-encoding the whole digest.
+    return hashlib.sha256(data).digest()[:8].hex()
+
+
+def line_indent_start(code: str, pos: int) -> int:
+    """Return the start of the line holding pos, or -1 if text precedes pos on it."""
+    start = code.rfind('\n', 0, pos) + 1
+    if start == pos or code[start:pos].isspace():
+        return start
+    return -1
+
+
+@dataclass(slots=True)
 class ExampleMetadata:
     """Metadata for a single AHK v2 example."""
     filename: str
@@ -36,8 +71,9 @@ class ExampleMetadata:
 class ExampleIntegrator:
     """Integrates scraped examples with repository examples."""
 
-    def __init__(self, repo_root: Path):
+    def __init__(self, repo_root: Path, pretty: bool = True):
         self.repo_root = repo_root
+        self.pretty = pretty
         self.examples_dir = repo_root / "data/raw_scripts/AHK_v2_Examples"
         self.scraped_json = Path("/tmp/ahkv2_scraped_examples.json")
         self.output_catalog = repo_root / "data/examples_catalog.json"
@@ -54,7 +90,6 @@ class ExampleIntegrator:
 
     def extract_metadata_from_code(self, code: str) -> Dict[str, any]:
         """Extract metadata from AHK code."""
-        lines = code.split('\n')
         metadata = {
             'title': '',
             'category': 'Uncategorized',
@@ -62,40 +97,52 @@ class ExampleIntegrator:
             'library_dependencies': []
         }
 
-        # Extract from header comments
-        for line in lines[:20]:  # Check first 20 lines
-            line = line.strip()
-            if line.startswith('; Title:'):
-                metadata['title'] = line.replace('; Title:', '').strip()
-            elif line.startswith('; Category:'):
-                metadata['category'] = line.replace('; Category:', '').strip()
-            elif line.startswith('; Description:'):
-                metadata['description'] = line.replace('; Description:', '').strip()
-            elif line.startswith('; Library:'):
-                lib = line.replace('; Library:', '').strip()
-                if lib:
-                    metadata['library_dependencies'].append(lib)
+        libraries = metadata['library_dependencies']
+
+        # Extract from header comments in the first HEADER_LINES lines; a
+        # match cannot span the newline ending that range.
+        header_end = -1
+        for _ in range(HEADER_LINES):
+            header_end = code.find('\n', header_end + 1)
+            if header_end == -1:
+                header_end = len(code)
+                break
+        for match in HEADER_RE.finditer(code, 0, header_end):
+            start = line_indent_start(code, match.start())
+            if start < 0:
+                continue
+            end = code.find('\n', match.start())
+            if end == -1:
+                end = len(code)
+            key = match.group(1)
+            value = code[start:end].strip().replace(f'; {key}:', '').strip()
+            if key == 'Library':
+                if value:
+                    libraries.append(value)
+            else:
+                metadata[key.lower()] = value
 
         # Extract #Include dependencies
-        include_pattern = re.compile(r'^\s*#Include\s+<([^>]+)>', re.IGNORECASE)
-        for line in lines:
-            match = include_pattern.match(line)
-            if match:
+        for match in INCLUDE_RE.finditer(code):
+            if line_indent_start(code, match.start()) >= 0:
                 lib = match.group(1)
-                if lib not in metadata['library_dependencies']:
-                    metadata['library_dependencies'].append(lib)
+                if lib not in libraries:
+                    libraries.append(lib)
 
         return metadata
 
-    def analyze_file(self, file_path: Path) -> ExampleMetadata:
+    def analyze_file(self, entry: os.DirEntry) -> ExampleMetadata:
         """Analyze a single .ahk file and extract metadata."""
-        try:
-            code = file_path.read_text(encoding='utf-8')
-        except UnicodeDecodeError:
-            code = file_path.read_text(encoding='utf-8-sig')
+        with open(entry.path, 'rb') as f:
+            raw = f.read()
+        # Same newline translation read_text() applies, done on the bytes.
+        if b'\r' in raw:
+            raw = raw.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
 
-        # Calculate hash
-        code_hash = hashlib.sha256(code.encode('utf-8')).hexdigest()[:16]
+        # Hash the bytes directly; for UTF-8 files this equals hashing the
+        # decoded text re-encoded, without the extra copy.
+        code_hash = code_hash_of(raw)
+        code = raw.removeprefix(UTF8_BOM).decode('utf-8', errors='replace')
 
         # Extract metadata from code
         metadata = self.extract_metadata_from_code(code)
@@ -104,16 +151,17 @@ class ExampleIntegrator:
         v2_verified = '#Requires AutoHotkey v2' in code
 
         return ExampleMetadata(
-            filename=file_path.name,
-            title=metadata['title'] or file_path.stem.replace('_', ' '),
+            filename=entry.name,
+            title=metadata['title'] or os.path.splitext(entry.name)[0].replace('_', ' '),
             category=metadata['category'],
             source_url=None,  # Will be enriched if found in scraped data
             description=metadata['description'],
             v2_verified=v2_verified,
             library_dependencies=metadata['library_dependencies'],
             code_hash=code_hash,
-            file_size=file_path.stat().st_size,
-            line_count=len(code.split('\n'))
+            file_size=entry.stat().st_size,
+            # Same value as the old len(code.split('\n')), trailing newline included
+            line_count=code.count('\n') + 1
         )
 
     def catalog_existing_examples(self) -> Dict[str, ExampleMetadata]:
@@ -124,9 +172,23 @@ class ExampleIntegrator:
             print(f"Warning: {self.examples_dir} not found")
             return catalog
 
-        for ahk_file in sorted(self.examples_dir.glob("*.ahk")):
-            metadata = self.analyze_file(ahk_file)
-            catalog[ahk_file.name] = metadata
+        # scandir entries carry name/path and cache their stat, so listing
+        # and sizing each file needs no extra Path objects or lookups.
+        # Sorting on normcase(name) matches how Path objects order, which is
+        # case-insensitive on Windows.
+        with os.scandir(self.examples_dir) as it:
+            entries = sorted(
+                (e for e in it
+                 if os.path.normcase(e.name).endswith('.ahk') and e.is_file()),
+                key=lambda e: os.path.normcase(e.name)
+            )
+
+        # Files are independent and analyze_file keeps no state, so read and
+        # hash them on a pool; map() keeps the results in listing order.
+        workers = min(32, (os.cpu_count() or 1) * 2)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for metadata in executor.map(self.analyze_file, entries):
+                catalog[metadata.filename] = metadata
 
         return catalog
 
@@ -134,11 +196,10 @@ class ExampleIntegrator:
                                  scraped_data: List[Dict]) -> Dict[str, ExampleMetadata]:
         """Enrich catalog with scraped metadata by matching code hashes."""
         # Create hash lookup for scraped data
-        scraped_by_hash = {}
-        for item in scraped_data:
-            code = item.get('code', '')
-            code_hash = hashlib.sha256(code.encode('utf-8')).hexdigest()[:16]
-            scraped_by_hash[code_hash] = item
+        scraped_by_hash = {
+            code_hash_of(item.get('code', '').encode('utf-8')): item
+            for item in scraped_data
+        }
 
         # Enrich catalog
         enriched = 0
@@ -151,25 +212,30 @@ class ExampleIntegrator:
         print(f"Enriched {enriched}/{len(catalog)} examples with source URLs")
         return catalog
 
-    def generate_reports(self, catalog: Dict[str, ExampleMetadata]):
+    def generate_reports(self, catalog: Dict[str, ExampleMetadata],
+                         stats: Optional[Dict[str, any]] = None):
         """Generate catalog JSON and CSV reports."""
+        if stats is None:
+            stats = self._catalog_stats(catalog)
         # Convert to serializable format
         catalog_data = {
             'generated': '2025-11-20',
-            'total_examples': len(catalog),
-            'v2_verified': sum(1 for m in catalog.values() if m.v2_verified),
-            'with_source_urls': sum(1 for m in catalog.values() if m.source_url),
-            'categories': self._count_by_category(catalog),
+            'total_examples': stats['total'],
+            'v2_verified': stats['v2_verified'],
+            'with_source_urls': stats['with_source_urls'],
+            'categories': stats['categories'],
             'examples': {k: asdict(v) for k, v in catalog.items()}
         }
 
-        # Write JSON catalog
-        with open(self.output_catalog, 'w', encoding='utf-8') as f:
-            json.dump(catalog_data, f, indent=2, ensure_ascii=False)
+        # Write JSON catalog (indented unless compact output was asked for)
+        layout = {'indent': 2} if self.pretty else {'separators': (',', ':')}
+        with open(self.output_catalog, 'w', encoding='utf-8', buffering=WRITE_BUFSIZE) as f:
+            json.dump(catalog_data, f, ensure_ascii=False, **layout)
         print(f"Created catalog: {self.output_catalog}")
 
         # Write CSV metadata
-        with open(self.output_csv, 'w', encoding='utf-8', newline='') as f:
+        with open(self.output_csv, 'w', encoding='utf-8', newline='',
+                  buffering=WRITE_BUFSIZE) as f:
             writer = csv.DictWriter(f, fieldnames=[
                 'filename', 'title', 'category', 'source_url', 'description',
                 'v2_verified', 'library_count', 'libraries', 'code_hash',
@@ -177,8 +243,8 @@ class ExampleIntegrator:
             ])
             writer.writeheader()
 
-            for metadata in sorted(catalog.values(), key=lambda m: m.filename):
-                writer.writerow({
+            writer.writerows(
+                {
                     'filename': metadata.filename,
                     'title': metadata.title,
                     'category': metadata.category,
@@ -190,26 +256,39 @@ class ExampleIntegrator:
                     'code_hash': metadata.code_hash,
                     'file_size': metadata.file_size,
                     'line_count': metadata.line_count
-                })
+                }
+                for metadata in sorted(catalog.values(), key=lambda m: m.filename)
+            )
 
         print(f"Created CSV metadata: {self.output_csv}")
 
+    def _catalog_stats(self, catalog: Dict[str, ExampleMetadata]) -> Dict[str, any]:
+        """Compute the counts shared by generate_reports and print_summary."""
+        values = list(catalog.values())
+        return {
+            'total': len(values),
+            'v2_verified': sum([m.v2_verified for m in values]),
+            'with_source_urls': sum([1 for m in values if m.source_url]),
+            'with_libs': sum([1 for m in values if m.library_dependencies]),
+            'categories': self._count_by_category(catalog),
+        }
+
     def _count_by_category(self, catalog: Dict[str, ExampleMetadata]) -> Dict[str, int]:
         """Count examples by category."""
-        counts = {}
-        for metadata in catalog.values():
-            category = metadata.category
-            counts[category] = counts.get(category, 0) + 1
-        return dict(sorted(counts.items(), key=lambda x: x[1], reverse=True))
+        # most_common() sorts by count, keeping first-seen order for ties.
+        return dict(Counter(m.category for m in catalog.values()).most_common())
 
-    def print_summary(self, catalog: Dict[str, ExampleMetadata]):
+    def print_summary(self, catalog: Dict[str, ExampleMetadata],
+                      stats: Optional[Dict[str, any]] = None):
         """Print integration summary."""
-        total = len(catalog)
-        v2_verified = sum(1 for m in catalog.values() if m.v2_verified)
-        with_urls = sum(1 for m in catalog.values() if m.source_url)
-        with_libs = sum(1 for m in catalog.values() if m.library_dependencies)
+        if stats is None:
+            stats = self._catalog_stats(catalog)
+        total = stats['total']
+        v2_verified = stats['v2_verified']
+        with_urls = stats['with_source_urls']
+        with_libs = stats['with_libs']
 
-        categories = self._count_by_category(catalog)
+        categories = stats['categories']
 
         print("\n" + "="*60)
         print("EXAMPLE CATALOG SUMMARY")
@@ -245,16 +324,28 @@ class ExampleIntegrator:
 
         # Generate reports
         print("Generating reports...")
-        self.generate_reports(catalog)
+        stats = self._catalog_stats(catalog)
+        self.generate_reports(catalog, stats)
 
         # Print summary
-        self.print_summary(catalog)
+        self.print_summary(catalog, stats)
 
 
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Integrate scraped example metadata with repository examples"
+    )
+    parser.add_argument(
+        "--pretty",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Indent the catalog JSON; --no-pretty writes it compact (default: --pretty)"
+    )
+    args = parser.parse_args()
+
     repo_root = Path(__file__).parent.parent
-    integrator = ExampleIntegrator(repo_root)
+    integrator = ExampleIntegrator(repo_root, pretty=args.pretty)
     integrator.run()
 
 
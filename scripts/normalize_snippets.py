@@ -18,12 +18,21 @@ Example usage:
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import os
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Iterator, Sequence
+from typing import Iterable, Sequence
 
+if __package__:
+    from .ahk_files import iter_ahk_files
+else:
+    from ahk_files import iter_ahk_files
+
+# Files that needed no edits last run, keyed by path, with their mtime/size.
+CACHE_PATH = Path(".cache") / "normalize_snippets" / "index.json"
 
 DEFAULT_PATTERNS: Sequence[tuple[str, str]] = (
     # Common converter artefacts → meaningful identifiers.
@@ -36,28 +45,75 @@ DEFAULT_PATTERNS: Sequence[tuple[str, str]] = (
 )
 
 
-@dataclass
+# Characters that end the plain-text prefix of a regex source.
+REGEX_SPECIAL = frozenset("\\.^$*+?{}[]|()")
+
+
+@dataclass(slots=True)
 class Replacement:
     pattern: re.Pattern[str]
     replacement: str
+    # Text every match must contain, or None if there is no such prefix.
+    literal: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EditRecord:
     path: str
     replacements: list[str]
 
 
+def leading_literal(source: str) -> str | None:
+    """Return the plain text a match of ``source`` must start with, if any.
+
+    Conservative: any alternation, or a pattern opening with a group, class,
+    escape or inline flag, yields None.
+    """
+    if "|" in source:
+        return None
+    end = 0
+    while end < len(source) and source[end] not in REGEX_SPECIAL:
+        end += 1
+    # A quantifier after the run makes its last character optional.
+    if 0 < end < len(source) and source[end] in "?*{":
+        end -= 1
+    return source[:end] or None
+
+
 def compile_replacements(pairs: Sequence[tuple[str, str]]) -> list[Replacement]:
     compiled = []
     for source, target in pairs:
-        compiled.append(Replacement(pattern=re.compile(source), replacement=target))
+        compiled.append(
+            Replacement(pattern=re.compile(source), replacement=target, literal=leading_literal(source))
+        )
     return compiled
 
 
+def may_match(text: str, replacements: Sequence[Replacement]) -> bool:
+    """Cheap prescreen: False only if no replacement can match ``text``.
+
+    Replacements apply in sequence, but if none matches the original text
+    none changes it, so later patterns never see new text either.
+    """
+    for repl in replacements:
+        if repl.literal is None or repl.literal in text:
+            return True
+    return False
+
+
+# Compiled once at import; load_patterns only compiles the --pattern extras.
+DEFAULT_REPLACEMENTS: list[Replacement] = compile_replacements(DEFAULT_PATTERNS)
+
+
 def apply_replacements(text: str, replacements: Sequence[Replacement]) -> tuple[str, list[str]]:
     edits: list[str] = []
     updated = text
+    # Patterns run one at a time on purpose: each sees the previous one's
+    # output (user patterns may rewrite default replacements), and a pattern
+    # starting with a literal gets re's fast prefix search, which a combined
+    # alternation of all patterns loses. In such an alternation group numbers
+    # are also global, so Match.expand() would resolve a template's \g<1>
+    # against the first pattern's group rather than the one that matched.
     for repl in replacements:
         new_text, count = repl.pattern.subn(repl.replacement, updated)
         if count:
@@ -66,31 +122,56 @@ def apply_replacements(text: str, replacements: Sequence[Replacement]) -> tuple[
     return updated, edits
 
 
-def iter_files(root: Path) -> Iterator[Path]:
-    for path in sorted(root.rglob("*.ahk")):
-        if path.is_file():
-            yield path
-
-
 def load_patterns(args: argparse.Namespace) -> list[Replacement]:
-    pairs: list[tuple[str, str]] = list(DEFAULT_PATTERNS)
+    pairs: list[tuple[str, str]] = []
     for pair in args.pattern:
         if "=" not in pair:
             raise ValueError(f"Invalid pattern specification: {pair!r}")
         lhs, rhs = pair.split("=", 1)
         pairs.append((lhs.strip(), rhs.strip()))
-    return compile_replacements(pairs)
+    return [*DEFAULT_REPLACEMENTS, *compile_replacements(pairs)]
+
+
+def patterns_key(replacements: Sequence[Replacement]) -> str:
+    """Fingerprint of the replacement set; a different set invalidates the cache."""
+    spec = [[repl.pattern.pattern, repl.replacement] for repl in replacements]
+    return hashlib.sha256(json.dumps(spec).encode("utf-8")).hexdigest()
+
+
+def load_clean_files(path: Path, key: str) -> dict[str, list[int]]:
+    try:
+        cache = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("patterns") != key:
+        return {}
+    return cache.get("files", {})
+
+
+def save_clean_files(path: Path, key: str, files: dict[str, list[int]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps({"patterns": key, "files": files}), encoding="utf-8")
+    os.replace(tmp_path, path)
 
 
 def render_report(edits: Iterable[EditRecord]) -> str:
-    structured = [edit.__dict__ for edit in edits if edit.replacements]
+    structured = [
+        {"path": edit.path, "replacements": edit.replacements} for edit in edits if edit.replacements
+    ]
     return json.dumps(structured, indent=2, ensure_ascii=False)
 
 
 def process_file(path: Path, replacements: Sequence[Replacement], dry_run: bool) -> EditRecord:
     original = path.read_text(encoding="utf-8")
+    # Most files hit no pattern; a substring test per literal settles that
+    # faster than running each regex over the text.
+    if not may_match(original, replacements):
+        return EditRecord(path=path.as_posix(), replacements=[])
     updated, notes = apply_replacements(original, replacements)
-    if notes and not dry_run:
+    # A match can substitute identical text (e.g. a user pattern that
+    # rewrites to itself); report it, but don't rewrite the file.
+    if notes and not dry_run and updated != original:
         path.write_text(updated, encoding="utf-8")
     return EditRecord(path=path.as_posix(), replacements=notes)
 
@@ -106,6 +187,11 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument("--dry-run", action="store_true", help="Preview changes without writing files.")
     parser.add_argument("--report", type=Path, help="Optional path to write JSON report of edits.")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Re-read every file instead of skipping ones recorded clean in {CACHE_PATH}.",
+    )
     return parser.parse_args()
 
 
@@ -117,15 +203,31 @@ def main() -> None:
     if not root.exists():
         raise FileNotFoundError(f"Root directory not found: {root}")
 
+    # Only files that needed no edits are remembered: an edited file may match
+    # again on the next run (e.g. the Issue # rewrite keeps its own text).
+    key = patterns_key(replacements)
+    clean = {} if args.no_cache else load_clean_files(CACHE_PATH, key)
+    still_clean: dict[str, list[int]] = {}
+
     edits: list[EditRecord] = []
-    for path in iter_files(root):
+    for path in map(Path, iter_ahk_files(root)):
+        st = path.stat()
+        stamp = [st.st_mtime_ns, st.st_size]
+        if clean.get(path.as_posix()) == stamp:
+            still_clean[path.as_posix()] = stamp
+            continue
         record = process_file(path, replacements, dry_run=args.dry_run)
         if record.replacements:
             print(f"[+] {path}:")
             for note in record.replacements:
                 print(f"    - {note}")
+        else:
+            still_clean[record.path] = stamp
         edits.append(record)
 
+    if not args.no_cache:
+        save_clean_files(CACHE_PATH, key, still_clean)
+
     if args.report:
         args.report.parent.mkdir(parents=True, exist_ok=True)
         args.report.write_text(render_report(edits), encoding="utf-8")
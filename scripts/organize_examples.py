@@ -14,7 +14,9 @@ Files are moved based on their filename prefix:
 - StdLib_*.ahk -> StdLib/
 """
 
+import errno
 import os
+import re
 import shutil
 from pathlib import Path
 
@@ -94,6 +96,10 @@ PREFIX_TO_FOLDER = {
     "Local": "Misc",
 }
 
+# Prefixes are alphanumeric, so the only one that can match a filename is
+# the text before its first "_" or "-".
+PREFIX_RE = re.compile(r"[A-Za-z0-9]+(?=[_-])")
+
 def get_target_folder(filename: str) -> str | None:
     """
     Determine the target folder based on filename prefix.
@@ -104,12 +110,19 @@ def get_target_folder(filename: str) -> str | None:
     Returns:
         Target folder name or None if no match
     """
-    # Check each prefix
-    for prefix, folder in PREFIX_TO_FOLDER.items():
-        # Match prefix followed by underscore or directly
-        if filename.startswith(f"{prefix}_") or filename.startswith(f"{prefix}-"):
-            return folder
-    return None
+    # Look up the prefix followed by underscore or hyphen
+    match = PREFIX_RE.match(filename)
+    return PREFIX_TO_FOLDER.get(match.group()) if match else None
+
+
+def move_file(src: Path, dst: Path) -> None:
+    """Rename src to dst, falling back to a copy across filesystems."""
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(str(src), str(dst))
 
 
 def organize_files(dry_run: bool = True) -> dict:
@@ -136,6 +149,7 @@ def organize_files(dry_run: bool = True) -> dict:
     print(f"Found {len(ahk_files)} .ahk files in base directory")
     print(f"{'DRY RUN - ' if dry_run else ''}Processing files...\n")
 
+    moves = []
     for file_path in sorted(ahk_files):
         filename = file_path.name
         target_folder = get_target_folder(filename)
@@ -144,24 +158,29 @@ def organize_files(dry_run: bool = True) -> dict:
             stats["no_match"].append(filename)
             continue
 
-        target_dir = BASE_DIR / target_folder
-        target_path = target_dir / filename
-
         # Check if file already exists in target
-        if target_path.exists():
+        if (BASE_DIR / target_folder / filename).exists():
             stats["already_in_folder"].append(filename)
             continue
 
-        # Create target directory if it doesn't exist
+        moves.append((file_path, target_folder))
+
+    # Create each missing target directory once, before any file is moved
+    for target_folder in dict.fromkeys(folder for _, folder in moves):
+        target_dir = BASE_DIR / target_folder
         if not target_dir.exists():
             if not dry_run:
                 target_dir.mkdir(parents=True)
             print(f"  Creating directory: {target_folder}/")
 
+    for file_path, target_folder in moves:
+        filename = file_path.name
+        target_path = BASE_DIR / target_folder / filename
+
         # Move the file
         try:
             if not dry_run:
-                shutil.move(str(file_path), str(target_path))
+                move_file(file_path, target_path)
             stats["moved"].append((filename, target_folder))
             print(f"  {'Would move' if dry_run else 'Moved'}: {filename} -> {target_folder}/")
         except Exception as e:
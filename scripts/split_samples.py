@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Split data/samples.jsonl into fixed-size shards for the grader.
+
+Each shard holds whole records and stays under --max-mb, except that a single
+record larger than the limit gets a shard of its own. Shards left in --out-dir
+by an earlier run are deleted first.
+
+A manifest.json next to the shards records, per shard, the global index of its
+first record so grader_app.py can map an example index to (shard, line) without
+reading every shard, plus the size and mtime of the input; the grader ignores
+the shards once data/samples.jsonl no longer matches them. Blank lines are
+dropped, matching how the grader counts records.
+
+Usage:
+    python scripts/split_samples.py [--input data/samples.jsonl] [--out-dir data/shards]
+    python scripts/split_samples.py --max-mb 64
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+SHARD_NAME = "samples_{:04d}.jsonl"
+SHARD_GLOB = "samples_*.jsonl"
+WRITE_BUFSIZE = 1 << 20
+
+
+def split_samples(input_path: Path, out_dir: Path, max_bytes: int) -> dict:
+    """Write the shards and return the manifest describing them."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    # Drop the old manifest first so an interrupted run never leaves one
+    # pointing at shards that are being replaced
+    (out_dir / "manifest.json").unlink(missing_ok=True)
+    for old in out_dir.glob(SHARD_GLOB):
+        old.unlink()
+    shards = []
+    out = None
+    size = 0
+    total = 0
+
+    with open(input_path, "rb") as src:
+        for line in src:
+            if not line.strip():
+                continue
+            if not line.endswith(b"\n"):
+                line += b"\n"
+            if out is None or (size and size + len(line) > max_bytes):
+                if out is not None:
+                    out.close()
+                name = SHARD_NAME.format(len(shards))
+                out = open(out_dir / name, "wb", buffering=WRITE_BUFSIZE)
+                shards.append({"file": name, "start": total, "count": 0})
+                size = 0
+            out.write(line)
+            size += len(line)
+            shards[-1]["count"] += 1
+            total += 1
+    if out is not None:
+        out.close()
+
+    st = input_path.stat()
+    manifest = {
+        "total": total,
+        "shards": shards,
+        "source": {"size": st.st_size, "mtime_ns": st.st_mtime_ns},
+    }
+    (out_dir / "manifest.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Split samples.jsonl into shards with a manifest"
+    )
+    parser.add_argument(
+        "--input",
+        type=Path,
+        default=Path("data/samples.jsonl"),
+        help="JSONL file to split (default: data/samples.jsonl)"
+    )
+    parser.add_argument(
+        "--out-dir",
+        type=Path,
+        default=Path("data/shards"),
+        help="Directory for shards and manifest.json (default: data/shards)"
+    )
+    parser.add_argument(
+        "--max-mb",
+        type=int,
+        default=128,
+        help="Maximum shard size in MiB (default: 128)"
+    )
+
+    args = parser.parse_args()
+
+    if not args.input.exists():
+        print(f"Error: Input file not found: {args.input}")
+        return 1
+
+    manifest = split_samples(args.input, args.out_dir, args.max_mb << 20)
+    print(f"Wrote {manifest['total']} records to {len(manifest['shards'])} shards in {args.out_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
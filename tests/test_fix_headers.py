@@ -0,0 +1,92 @@
+"""Unit tests for the mtime cache in fix_headers.py"""
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import fix_headers
+
+
+class TestHeaderCache(unittest.TestCase):
+    """Tests for skipping files already known to carry both headers."""
+
+    def setUp(self):
+        """Create temporary directory with scripts and a cache path."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name) / "Scripts"
+        self.root.mkdir()
+        self.cache_path = str(Path(self.tmpdir.name) / "header_cache.json")
+        self.done = self.root / "done.ahk"
+        self.done.write_bytes(b"#Requires AutoHotkey v2.0\n#SingleInstance Force\nMsgBox('a')\n")
+        self.missing = self.root / "missing.ahk"
+        self.missing.write_bytes(b"MsgBox('b')\r\n")
+
+    def tearDown(self):
+        """Clean up temporary directory."""
+        self.tmpdir.cleanup()
+
+    def run_fix(self):
+        """Run fix_ahk_headers and return the names of the files it read."""
+        spy = mock.Mock(wraps=fix_headers.process_file)
+        with mock.patch.object(fix_headers, "process_file", spy), \
+                contextlib.redirect_stdout(io.StringIO()):
+            fix_headers.fix_ahk_headers(str(self.root), self.cache_path)
+        return sorted(Path(call.args[0]).name for call in spy.call_args_list)
+
+    def load_cache(self):
+        with open(self.cache_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def test_first_run_fixes_and_caches(self):
+        """Test that a cold run reads every file and caches the fixed mtimes."""
+        self.assertEqual(self.run_fix(), ["done.ahk", "missing.ahk"])
+
+        self.assertTrue(self.missing.read_bytes().startswith(
+            b"#Requires AutoHotkey v2.0\r\n#SingleInstance Force\r\n"))
+        cache = self.load_cache()
+        self.assertEqual(cache[str(self.done)], self.done.stat().st_mtime_ns)
+        self.assertEqual(cache[str(self.missing)], self.missing.stat().st_mtime_ns,
+                         "a fixed file is cached with its mtime after the write")
+
+    def test_second_run_reads_nothing(self):
+        """Test that files unchanged since the last run are skipped."""
+        self.run_fix()
+
+        self.assertEqual(self.run_fix(), [])
+
+    def test_touched_file_is_read_again(self):
+        """Test that an mtime change invalidates a file's cache entry."""
+        self.run_fix()
+        st = self.done.stat()
+        os.utime(self.done, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+
+        self.assertEqual(self.run_fix(), ["done.ahk"])
+
+    def test_edited_file_is_fixed_again(self):
+        """Test that a file losing its headers is fixed on the next run."""
+        self.run_fix()
+        self.done.write_bytes(b"MsgBox('headers removed')\n")
+        st = self.done.stat()
+        os.utime(self.done, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+
+        self.assertEqual(self.run_fix(), ["done.ahk"])
+        self.assertTrue(self.done.read_bytes().startswith(b"#Requires AutoHotkey v2.0\n"))
+
+    def test_unreadable_cache_starts_cold(self):
+        """Test that a corrupt cache file is treated as empty."""
+        with open(self.cache_path, "w", encoding="utf-8") as f:
+            f.write("{not json")
+
+        self.assertEqual(self.run_fix(), ["done.ahk", "missing.ahk"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+"""Unit tests for the result cache in scripts/format_ahk_examples.py"""
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts import format_ahk_examples
+
+
+class TestResultCache(unittest.TestCase):
+    """Tests for reusing per-file results across runs."""
+
+    def setUp(self):
+        """Create a temporary working directory with a few scripts."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.old_cwd = os.getcwd()
+        os.chdir(self.tmpdir.name)
+        self.root = Path(self.tmpdir.name) / "scripts"
+        self.root.mkdir()
+        self.clean = self.root / "clean.ahk"
+        self.clean.write_bytes(b"#Requires AutoHotkey v2.0\nMsgBox('ok')\n")
+        self.dirty = self.root / "dirty.ahk"
+        self.dirty.write_bytes(b"MsgBox('trailing')  \n")
+
+    def tearDown(self):
+        """Clean up temporary directory."""
+        os.chdir(self.old_cwd)
+        self.tmpdir.cleanup()
+
+    def run_check(self, *extra):
+        """Run a check pass and return the paths the worker actually scanned."""
+        argv = ["format_ahk_examples.py", "--root", str(self.root), "--jobs", "1", *extra]
+        spy = mock.Mock(wraps=format_ahk_examples.check_only)
+        with mock.patch.object(sys, "argv", argv), \
+                mock.patch.object(format_ahk_examples, "check_only", spy), \
+                contextlib.redirect_stdout(io.StringIO()), \
+                self.assertRaises(SystemExit):
+            format_ahk_examples.main()
+        return sorted(Path(call.args[0]).name for call in spy.call_args_list)
+
+    def load_cache(self):
+        return json.loads(format_ahk_examples.RESULT_CACHE_PATH.read_text(encoding="utf-8"))
+
+    def bump_mtime(self, path):
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+
+    def test_first_run_scans_and_caches_every_file(self):
+        """Test that a cold run scans every file and records its stat and hash."""
+        scanned = self.run_check()
+
+        self.assertEqual(scanned, ["clean.ahk", "dirty.ahk"])
+        entry = self.load_cache()[str(self.dirty)]
+        st = self.dirty.stat()
+        self.assertEqual(entry["mode"], "check")
+        self.assertEqual(entry["mtime_ns"], st.st_mtime_ns)
+        self.assertEqual(entry["size"], st.st_size)
+        self.assertTrue(entry["findings"], "findings for the dirty file must be cached")
+
+    def test_unchanged_files_are_not_rescanned(self):
+        """Test that a second run reuses every cached result."""
+        self.run_check()
+
+        self.assertEqual(self.run_check(), [])
+
+    def test_cached_findings_match_a_fresh_scan(self):
+        """Test that results rebuilt from the cache equal a real scan."""
+        self.run_check()
+        entry = self.load_cache()[str(self.dirty)]
+
+        cached = format_ahk_examples.cached_result(str(self.dirty), entry)
+        fresh = format_ahk_examples.check_only(str(self.dirty))
+
+        self.assertEqual(cached.as_dict(), fresh.as_dict())
+
+    def test_touched_file_reuses_result_by_hash(self):
+        """Test that an mtime-only change is settled by the content hash."""
+        self.run_check()
+        self.bump_mtime(self.clean)
+
+        self.assertEqual(self.run_check(), [])
+        self.assertEqual(self.load_cache()[str(self.clean)]["mtime_ns"], self.clean.stat().st_mtime_ns)
+
+    def test_changed_content_is_rescanned(self):
+        """Test that a file whose size and content changed is scanned again."""
+        self.run_check()
+        self.clean.write_bytes(b"#Requires AutoHotkey v2.0\nMsgBox('changed')   \n")
+
+        self.assertEqual(self.run_check(), ["clean.ahk"])
+
+    def test_same_size_edit_is_rescanned(self):
+        """Test that an edit keeping the size is caught by mtime and hash."""
+        self.run_check()
+        data = self.clean.read_bytes()
+        self.clean.write_bytes(data.replace(b"ok", b"OK"))
+        self.bump_mtime(self.clean)
+
+        self.assertEqual(self.run_check(), ["clean.ahk"])
+
+    def test_no_cache_rescans_everything(self):
+        """Test that --no-cache ignores the stored results."""
+        self.run_check()
+
+        self.assertEqual(self.run_check("--no-cache"), ["clean.ahk", "dirty.ahk"])
+
+
+if __name__ == "__main__":
+    unittest.main()
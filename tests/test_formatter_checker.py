@@ -0,0 +1,71 @@
+"""Unit tests for ahk_formatter_checker.py"""
+
+import unittest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ahk_formatter_checker import (
+    _MAX_PER_CATEGORY,
+    add_issue,
+    count_issues,
+)
+
+
+class TestAddIssue(unittest.TestCase):
+    """Tests for the per-category issue cap in add_issue/count_issues."""
+
+    def fill(self, count):
+        issues = []
+        for line in range(1, count + 1):
+            add_issue(issues, line, f"issue {line}")
+        return issues
+
+    def test_below_cap_keeps_every_issue(self):
+        """Test that issues under the cap are all stored as given."""
+        issues = self.fill(3)
+
+        self.assertEqual(len(issues), 3)
+        self.assertEqual(issues[0], {"line": 1, "description": "issue 1"})
+        self.assertEqual(count_issues(issues), 3)
+
+    def test_exactly_at_cap_adds_no_marker(self):
+        """Test that reaching the cap exactly stores no omitted marker."""
+        issues = self.fill(_MAX_PER_CATEGORY)
+
+        self.assertEqual(len(issues), _MAX_PER_CATEGORY)
+        self.assertNotIn("omitted", issues[-1])
+        self.assertEqual(count_issues(issues), _MAX_PER_CATEGORY)
+
+    def test_one_past_cap_adds_marker(self):
+        """Test that the first issue past the cap becomes the marker."""
+        issues = self.fill(_MAX_PER_CATEGORY + 1)
+
+        self.assertEqual(len(issues), _MAX_PER_CATEGORY + 1)
+        marker = issues[-1]
+        self.assertEqual(marker["omitted"], 1)
+        self.assertEqual(marker["description"], "... 1 more omitted")
+        self.assertEqual(marker["line"], _MAX_PER_CATEGORY + 1)
+        self.assertEqual(count_issues(issues), _MAX_PER_CATEGORY + 1)
+
+    def test_far_past_cap_keeps_one_marker(self):
+        """Test that further issues only bump the marker's count."""
+        total = _MAX_PER_CATEGORY + 250
+        issues = self.fill(total)
+
+        self.assertEqual(len(issues), _MAX_PER_CATEGORY + 1)
+        marker = issues[-1]
+        self.assertEqual(marker["omitted"], 250)
+        self.assertEqual(marker["description"], "... 250 more omitted")
+        # The marker keeps the line of the first issue left out
+        self.assertEqual(marker["line"], _MAX_PER_CATEGORY + 1)
+        self.assertEqual(count_issues(issues), total, "count must include omitted issues")
+
+    def test_empty_list_counts_zero(self):
+        """Test that a category without issues counts as zero."""
+        self.assertEqual(count_issues([]), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
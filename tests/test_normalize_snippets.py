@@ -0,0 +1,188 @@
+"""Unit tests for scripts/normalize_snippets.py"""
+
+import contextlib
+import io
+import os
+import random
+import re
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts import normalize_snippets
+from scripts.normalize_snippets import (
+    DEFAULT_PATTERNS,
+    apply_replacements,
+    compile_replacements,
+    leading_literal,
+    may_match,
+    process_file,
+)
+
+# Patterns covering each way a prefix can end: quantifiers, groups,
+# classes, escapes, anchors, inline flags and alternation
+PRESCREEN_PATTERNS = [
+    *DEFAULT_PATTERNS,
+    (r"ab?c", "X"),
+    (r"abc*", "X"),
+    (r"ab{0,2}c", "X"),
+    (r"ab+", "X"),
+    (r"colou?r", "X"),
+    (r"foo|bar", "X"),
+    (r"(ab)c", r"\1"),
+    (r"[ab]c", "X"),
+    (r"\d+z", "X"),
+    (r"x\.y", "X"),
+    (r"a.c", "X"),
+    (r"^start", "X"),
+    (r"end$", "X"),
+    (r"(?i)abc", "X"),
+    (r"Issue #", "X"),
+]
+
+TEXT_PIECES = ["a", "b", "c", "ab", "abc", "ac", "x.y", "xzy", "colour", "color", "foo", "bar",
+               "start", "end", "ABC", "1z", "Issue #", "Issue #12", "V1toV2_GblCode_001",
+               "HotkeyStressTest", "converter stress test", " ", "\n"]
+
+
+class TestPrescreen(unittest.TestCase):
+    """Tests that the literal-prefix prescreen never hides a real match."""
+
+    def random_texts(self, count):
+        rng = random.Random(1234)
+        for _ in range(count):
+            yield "".join(rng.choice(TEXT_PIECES) for _ in range(rng.randint(0, 12)))
+
+    def test_leading_literal_examples(self):
+        """Test the literal extracted for representative patterns."""
+        self.assertEqual(leading_literal(r"V1toV2_GblCode_001"), "V1toV2_GblCode_001")
+        self.assertEqual(leading_literal(r"Issue #(\d+)"), "Issue #")
+        self.assertEqual(leading_literal(r"ab?c"), "a")
+        self.assertEqual(leading_literal(r"ab+"), "ab")
+        self.assertIsNone(leading_literal(r"foo|bar"))
+        self.assertIsNone(leading_literal(r"(ab)c"))
+        self.assertIsNone(leading_literal(r"(?i)abc"))
+        self.assertIsNone(leading_literal(r"b?c"))
+
+    def test_every_match_contains_the_literal(self):
+        """Test that each match of a pattern starts with its leading literal."""
+        for source, _ in PRESCREEN_PATTERNS:
+            literal = leading_literal(source)
+            if literal is None:
+                continue
+            pattern = re.compile(source)
+            for text in self.random_texts(300):
+                for match in pattern.finditer(text):
+                    self.assertTrue(match.group(0).startswith(literal),
+                                    f"{source!r} matched {match.group(0)!r} without {literal!r}")
+
+    def test_prescreen_agrees_with_full_scan(self):
+        """Test that skipping on may_match gives the same result as always scanning."""
+        replacement_sets = [compile_replacements([pair]) for pair in PRESCREEN_PATTERNS]
+        replacement_sets.append(compile_replacements(PRESCREEN_PATTERNS))
+        for replacements in replacement_sets:
+            for text in self.random_texts(300):
+                full = apply_replacements(text, replacements)
+                if not may_match(text, replacements):
+                    self.assertEqual(full, (text, []),
+                                     f"prescreen skipped {text!r} for {replacements[0].pattern.pattern!r}")
+
+    def test_process_file_matches_full_scan(self):
+        """Test that process_file output equals an unscreened apply_replacements."""
+        replacements = compile_replacements(PRESCREEN_PATTERNS)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "snippet.ahk"
+            for text in self.random_texts(100):
+                path.write_text(text, encoding="utf-8")
+                expected, notes = apply_replacements(text, replacements)
+
+                record = process_file(path, replacements, dry_run=False)
+
+                self.assertEqual(record.replacements, notes)
+                self.assertEqual(path.read_text(encoding="utf-8"), expected)
+
+
+class TestCleanFileCache(unittest.TestCase):
+    """Tests for skipping files recorded clean on a previous run."""
+
+    def setUp(self):
+        """Create a temporary working directory with snippets."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.old_cwd = os.getcwd()
+        os.chdir(self.tmpdir.name)
+        self.root = Path(self.tmpdir.name) / "raw"
+        self.root.mkdir()
+        self.clean = self.root / "clean.ahk"
+        self.clean.write_text("MsgBox('nothing to rewrite')\n", encoding="utf-8")
+        self.legacy = self.root / "legacy.ahk"
+        self.legacy.write_text("V1toV2_GblCode_001()\n", encoding="utf-8")
+
+    def tearDown(self):
+        """Clean up temporary directory."""
+        os.chdir(self.old_cwd)
+        self.tmpdir.cleanup()
+
+    def run_normalize(self, *extra):
+        """Run main() and return the names of the files it read."""
+        argv = ["normalize_snippets.py", "--root", str(self.root), *extra]
+        spy = mock.Mock(wraps=normalize_snippets.process_file)
+        with mock.patch.object(sys, "argv", argv), \
+                mock.patch.object(normalize_snippets, "process_file", spy), \
+                contextlib.redirect_stdout(io.StringIO()):
+            normalize_snippets.main()
+        return sorted(call.args[0].name for call in spy.call_args_list)
+
+    def bump_mtime(self, path):
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+
+    def test_clean_files_are_skipped_next_run(self):
+        """Test that only files needing no edits are skipped on the next run."""
+        self.assertEqual(self.run_normalize(), ["clean.ahk", "legacy.ahk"])
+        self.assertEqual(self.legacy.read_text(encoding="utf-8"), "GlobalInitBlock()\n")
+
+        # The edited file is checked once more, then it is clean too
+        self.assertEqual(self.run_normalize(), ["legacy.ahk"])
+        self.assertEqual(self.run_normalize(), [])
+
+    def test_mtime_change_invalidates_entry(self):
+        """Test that touching a clean file makes it be read again."""
+        self.run_normalize()
+        self.run_normalize()
+        self.bump_mtime(self.clean)
+
+        self.assertEqual(self.run_normalize(), ["clean.ahk"])
+
+    def test_size_change_invalidates_entry(self):
+        """Test that a new artefact in a cached file is found and rewritten."""
+        self.run_normalize()
+        self.run_normalize()
+        st = self.clean.stat()
+        self.clean.write_text("HotkeyStressTest()\n", encoding="utf-8")
+        os.utime(self.clean, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        self.assertEqual(self.run_normalize(), ["clean.ahk"])
+        self.assertEqual(self.clean.read_text(encoding="utf-8"), "HotkeyDemo()\n")
+
+    def test_new_patterns_invalidate_cache(self):
+        """Test that a different replacement set re-reads every file."""
+        self.run_normalize()
+        self.run_normalize()
+
+        self.assertEqual(self.run_normalize("--pattern", "nothing=something"),
+                         ["clean.ahk", "legacy.ahk"])
+
+    def test_no_cache_reads_everything(self):
+        """Test that --no-cache ignores the recorded clean files."""
+        self.run_normalize()
+        self.run_normalize()
+
+        self.assertEqual(self.run_normalize("--no-cache"), ["clean.ahk", "legacy.ahk"])
+
+
+if __name__ == "__main__":
+    unittest.main()
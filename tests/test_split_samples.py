@@ -0,0 +1,187 @@
+"""Unit tests for scripts/split_samples.py and the grader's shard lookup"""
+
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import tempfile
+import unittest
+from bisect import bisect_right
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.split_samples import SHARD_NAME, split_samples
+
+
+def make_records(count):
+    """Records of growing size, so shards end up holding different counts."""
+    return [{"prompt": f"prompt {i}", "response": "x" * (i * 7)} for i in range(count)]
+
+
+def write_jsonl(path, records):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+
+
+def read_shard(path):
+    with open(path, "rb") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class TestSplitSamples(unittest.TestCase):
+    """Tests for split_samples and the manifest it writes."""
+
+    def setUp(self):
+        """Create temporary directory with a samples file."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        self.input = self.root / "samples.jsonl"
+        self.out_dir = self.root / "shards"
+        self.records = make_records(40)
+        write_jsonl(self.input, self.records)
+
+    def tearDown(self):
+        """Clean up temporary directory."""
+        self.tmpdir.cleanup()
+
+    def test_manifest_maps_every_index_to_its_record(self):
+        """Test that (shard, line) from the manifest starts finds each record."""
+        manifest = split_samples(self.input, self.out_dir, 1024)
+
+        self.assertGreater(len(manifest["shards"]), 1, "test needs several shards")
+        self.assertEqual(manifest["total"], len(self.records))
+        starts = [shard["start"] for shard in manifest["shards"]]
+        shard_records = [read_shard(self.out_dir / shard["file"]) for shard in manifest["shards"]]
+        for idx, record in enumerate(self.records):
+            n = bisect_right(starts, idx) - 1
+            self.assertEqual(shard_records[n][idx - starts[n]], record, f"record {idx}")
+
+    def test_shards_are_contiguous(self):
+        """Test that each shard starts where the previous one ended."""
+        manifest = split_samples(self.input, self.out_dir, 1024)
+
+        expected_start = 0
+        for shard in manifest["shards"]:
+            self.assertEqual(shard["start"], expected_start)
+            self.assertEqual(len(read_shard(self.out_dir / shard["file"])), shard["count"])
+            expected_start += shard["count"]
+        self.assertEqual(expected_start, manifest["total"])
+
+    def test_manifest_written_to_disk(self):
+        """Test that manifest.json matches the returned manifest."""
+        manifest = split_samples(self.input, self.out_dir, 1024)
+
+        on_disk = json.loads((self.out_dir / "manifest.json").read_text(encoding="utf-8"))
+        self.assertEqual(on_disk, manifest)
+
+    def test_shards_stay_under_limit(self):
+        """Test that shards holding several records stay under max_bytes."""
+        manifest = split_samples(self.input, self.out_dir, 1024)
+
+        for shard in manifest["shards"]:
+            if shard["count"] > 1:
+                self.assertLessEqual((self.out_dir / shard["file"]).stat().st_size, 1024)
+
+    def test_oversized_record_gets_own_shard(self):
+        """Test that a record larger than the limit is written alone."""
+        records = [{"prompt": "small", "response": "a"},
+                   {"prompt": "big", "response": "b" * 5000},
+                   {"prompt": "small", "response": "c"}]
+        write_jsonl(self.input, records)
+
+        manifest = split_samples(self.input, self.out_dir, 1024)
+
+        self.assertEqual([shard["count"] for shard in manifest["shards"]], [1, 1, 1])
+        self.assertEqual(read_shard(self.out_dir / manifest["shards"][1]["file"]), [records[1]])
+
+    def test_blank_lines_are_dropped(self):
+        """Test that blank lines do not count as records."""
+        self.input.write_text('{"prompt": "a", "response": "1"}\n\n  \n{"prompt": "b", "response": "2"}',
+                              encoding="utf-8")
+
+        manifest = split_samples(self.input, self.out_dir, 1024)
+
+        self.assertEqual(manifest["total"], 2)
+        self.assertEqual(len(read_shard(self.out_dir / manifest["shards"][0]["file"])), 2)
+
+    def test_rerun_removes_old_shards(self):
+        """Test that shards from an earlier, finer split are deleted."""
+        first = split_samples(self.input, self.out_dir, 512)
+        second = split_samples(self.input, self.out_dir, 1 << 20)
+
+        self.assertGreater(len(first["shards"]), 1)
+        self.assertEqual(len(second["shards"]), 1)
+        self.assertEqual(sorted(p.name for p in self.out_dir.glob("samples_*.jsonl")),
+                         [SHARD_NAME.format(0)])
+
+    def test_manifest_records_source_stamp(self):
+        """Test that the input's size and mtime are stored in the manifest."""
+        manifest = split_samples(self.input, self.out_dir, 1024)
+
+        st = self.input.stat()
+        self.assertEqual(manifest["source"], {"size": st.st_size, "mtime_ns": st.st_mtime_ns})
+
+
+@unittest.skipUnless(importlib.util.find_spec("gradio"), "gradio is not installed")
+class TestGraderShards(unittest.TestCase):
+    """Tests for the grader's lookup of examples through the shard manifest."""
+
+    def setUp(self):
+        """Create data/samples.jsonl and its shards in a temporary working directory."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.old_cwd = os.getcwd()
+        os.chdir(self.tmpdir.name)
+        self.records = make_records(40)
+        write_jsonl(Path("data/samples.jsonl"), self.records)
+        split_samples(Path("data/samples.jsonl"), Path("data/shards"), 1024)
+        self.grader = None
+
+    def tearDown(self):
+        """Stop the grader's flusher, close shards and clean up."""
+        if self.grader is not None:
+            self.grader.stop_flusher()
+            for shard in self.grader.shards:
+                if shard["file"] is not None:
+                    shard["file"].close()
+        sys.modules.pop("grader_app", None)
+        os.chdir(self.old_cwd)
+        self.tmpdir.cleanup()
+
+    def load_grader(self):
+        """Import grader_app afresh so it loads data from the working directory."""
+        sys.modules.pop("grader_app", None)
+        with contextlib.redirect_stdout(io.StringIO()):
+            import grader_app
+        self.grader = grader_app
+        return grader_app
+
+    def test_reads_every_record_from_shards(self):
+        """Test that every index resolves to its record via the shards."""
+        grader = self.load_grader()
+
+        self.assertGreater(len(grader.shards), 1)
+        self.assertTrue(all(s["path"].startswith(grader.SHARDS_DIR) for s in grader.shards))
+        self.assertEqual(grader.total, len(self.records))
+        for idx, record in enumerate(self.records):
+            self.assertEqual(grader.read_example(idx), record, f"record {idx}")
+
+    def test_stale_manifest_falls_back_to_samples(self):
+        """Test that samples.jsonl is read directly once it no longer matches the shards."""
+        extra = {"prompt": "added later", "response": "y"}
+        with open("data/samples.jsonl", "a", encoding="utf-8") as f:
+            f.write(json.dumps(extra) + "\n")
+
+        grader = self.load_grader()
+
+        self.assertEqual([s["path"] for s in grader.shards], [grader.DATA_PATH])
+        self.assertEqual(grader.total, len(self.records) + 1)
+        self.assertEqual(grader.read_example(len(self.records)), extra)
+
+
+if __name__ == "__main__":
+    unittest.main()